@@ -0,0 +1,15 @@
+"""Benchmarks - timings of the semitone workloads.
+
+Times a cold import of semitone, Tone comparisons, scale construction at
+small and huge sizes, Scale.extend, spiral geometry, SpiralPlot.draw, cache
+hits and image export, saves the results to JSON, and compares them against
+a stored baseline. Run from the repository root:
+    python -m benchmarks                  # run all, compare to baseline.json
+    python -m benchmarks --quick          # skip the huge workloads
+    python -m benchmarks -k draw          # run the benchmarks matching "draw"
+    python -m benchmarks --save-baseline  # make this run the new baseline
+
+See python -m benchmarks --help for thresholds and file locations. Timings
+depend on the machine, so regenerate the baseline before comparing on a new
+one.
+"""
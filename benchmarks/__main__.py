@@ -0,0 +1,120 @@
+"""Run the benchmarks: python -m benchmarks --help"""  # pylint: disable=invalid-name
+
+import argparse
+import sys
+from pathlib import Path
+from . import runner
+from .cases import BENCHMARKS
+
+_HERE = Path(__file__).parent
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmarks, save and compare the results.
+
+    Returns:
+        the exit status: 1 if any benchmark is slower than its baseline
+        beyond its threshold, else 0
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Time the semitone workloads and compare to a baseline.",
+    )
+    parser.add_argument(
+        "-k",
+        "--filter",
+        default="",
+        help="run only the benchmarks whose names contain this text",
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="skip the huge workloads"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="runs per benchmark (5)"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.25,
+        help=(
+            "allowed relative change before a timing counts as slower or "
+            "faster (0.25); the baseline may set its own per benchmark"
+        ),
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=_HERE / "baseline.json",
+        help="the baseline results (benchmarks/baseline.json)",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=_HERE / "results.json",
+        help="where to save the results (benchmarks/results.json)",
+    )
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="also save the results as the new baseline, keeping thresholds",
+    )
+    args = parser.parse_args(argv)
+
+    selected = [
+        benchmark
+        for benchmark in BENCHMARKS
+        if args.filter in benchmark.name and (benchmark.quick or not args.quick)
+    ]
+    baseline = runner.load(args.baseline)
+    results: dict = {"environment": runner.environment(), "benchmarks": {}}
+    width = max((len(benchmark.name) for benchmark in selected), default=0)
+    print(f"{'benchmark':<{width}}  {'time':>10}  {'baseline':>10}  ratio")
+    comparisons = []
+    for benchmark in selected:
+        timing = runner.time_benchmark(benchmark, args.repeat)
+        results["benchmarks"][benchmark.name] = timing
+        (comparison,) = runner.compare(
+            ((benchmark.name, timing["seconds"]),), baseline, args.threshold
+        )
+        comparisons.append(comparison)
+        print(_format_row(comparison, width), flush=True)
+
+    runner.save(args.output, results)
+    if args.save_baseline:
+        runner.save(
+            args.baseline,
+            {**results, "thresholds": baseline.get("thresholds", {})},
+        )
+    counts = {
+        status: sum(c.status == status for c in comparisons)
+        for status in ("slower", "faster", "same", "new")
+    }
+    print(", ".join(f"{count} {status}" for status, count in counts.items()))
+    return 1 if counts["slower"] else 0
+
+
+def _format_row(comparison: runner.Comparison, width: int) -> str:
+    """Return one line of the results table."""
+    baseline = (
+        "-"
+        if comparison.baseline is None
+        else _format_seconds(comparison.baseline)
+    )
+    ratio = "" if comparison.ratio is None else f"{comparison.ratio:.2f}x"
+    return (
+        f"{comparison.name:<{width}}  "
+        f"{_format_seconds(comparison.seconds):>10}  {baseline:>10}  "
+        f"{ratio:>6} {comparison.status}"
+    )
+
+
+def _format_seconds(seconds: float) -> str:
+    """Return a time with a readable unit, e.g. "12.3 ms"."""
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3g} {unit}"
+    return f"{seconds / 1e-9:.3g} ns"
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,192 @@
+"""The benchmarked workloads."""
+
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Any, Callable
+import numpy as np
+import plotly.io as pio
+import semitone as st
+from semitone.visuals import SpiralPlotCache, SpiralScale
+
+HUGE = 10**6  # size of the huge harmonic scales
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """One timed workload.
+
+    Attributes:
+        name (str): unique name, "<group>.<workload>"
+        setup (Callable): prepares the inputs outside the timing, and returns
+            the function to be timed, called with no arguments
+        quick (bool): False for workloads skipped by --quick
+    """
+
+    name: str
+    setup: Callable[[], Callable[[], object]]
+    quick: bool = True
+
+
+def _uncached(build: Callable[[], object]) -> Callable[[], object]:
+    """Return build, run with the shared scale cache emptied first.
+
+    Equal-tempered scales are memoized, so without this only the first call
+    would construct the scale.
+    """
+
+    def timed() -> object:
+        st.EqualTempered.cache_clear()
+        return build()
+
+    return timed
+
+
+def _cold_import() -> Callable[[], object]:
+    code = "import semitone as st; st.Major('C').extend(1, 1)"
+    return lambda: subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def _tone_equality() -> Callable[[], object]:
+    tones = [st.Tone(440.0 * 2 ** (n / 1200)) for n in range(1000)]
+    reference = st.Tone(440.0)
+    return lambda: [tone == reference for tone in tones]
+
+
+def _tone_unique() -> Callable[[], object]:
+    tones = [st.Tone(440.0 * 2 ** (n / 12000)) for n in range(10_000)]
+    return lambda: st.Tone.unique(tones)
+
+
+def _construct(build: Callable[[], object]) -> Callable[[], Callable]:
+    return lambda: _uncached(build)
+
+
+def _extend(
+    build: Callable[[], st.Scale], octaves: int
+) -> Callable[[], Callable]:
+    def setup() -> Callable[[], object]:
+        scale = build()
+        return lambda: scale.extend(octaves, octaves)
+
+    return setup
+
+
+def _spiral_scale() -> Callable[[], object]:
+    scale = st.HarmonicSeries("C", 10_000)
+    return lambda: SpiralScale(scale)
+
+
+def _polar_coords() -> Callable[[], object]:
+    freqs = st.HarmonicSeries("C", HUGE).frequencies
+    return lambda: SpiralScale.polar_coords_from_freqs(freqs, 261.63)
+
+
+def _draw(
+    build: Callable[[], tuple[st.Scale, ...]], octaves: int, **kwargs: Any
+) -> Callable[[], Callable]:
+    def setup() -> Callable[[], object]:
+        scales = build()
+        return lambda: st.SpiralPlot.draw(scales, octaves, octaves, **kwargs)
+
+    return setup
+
+
+def _draw_svg() -> Callable[[], object]:
+    scales = (st.Major("C"), st.Minor("D"), st.HarmonicOctave("C", 23))
+    return lambda: st.SpiralPlot.draw_svg(scales)
+
+
+def _draw_json() -> Callable[[], object]:
+    scales = tuple(st.Chromatic(_KEYS[i % 7]) for i in range(100))
+    return lambda: st.SpiralPlot.draw_json(scales, 4, 4)
+
+
+def _to_json() -> Callable[[], object]:
+    scales = tuple(st.Chromatic(_KEYS[i % 7]) for i in range(100))
+    return lambda: st.SpiralPlot.draw(scales, 4, 4).to_json()
+
+
+def _cache_hit(draw: str) -> Callable[[], Callable]:
+    def setup() -> Callable[[], object]:
+        scales = tuple(st.Chromatic(_KEYS[i % 7]) for i in range(100))
+        drawing = getattr(SpiralPlotCache(), draw)
+        drawing(scales, 4, 4)
+        return lambda: drawing(scales, 4, 4)
+
+    return setup
+
+
+def _to_png() -> Callable[[], object]:
+    fig = st.SpiralPlot.draw((st.Major("C"), st.Minor("D")))
+    pio.to_image(fig, format="png")  # start the export engine
+    return lambda: pio.to_image(fig, format="png")
+
+
+_KEYS = ("C", "D", "E", "F", "G", "A", "B")
+
+BENCHMARKS = (
+    Benchmark("import.cold_start", _cold_import),
+    Benchmark("tone.equality_1k", _tone_equality),
+    Benchmark("tone.unique_10k", _tone_unique),
+    Benchmark("construct.chromatic", _construct(lambda: st.Chromatic("C"))),
+    Benchmark("construct.major", _construct(lambda: st.Major("C"))),
+    Benchmark("construct.minor", _construct(lambda: st.Minor("C"))),
+    Benchmark(
+        "construct.diatonic_mode", _construct(lambda: st.DiatonicMode("C", 2))
+    ),
+    Benchmark(
+        "construct.just_tempered", _construct(lambda: st.JustTempered("C"))
+    ),
+    Benchmark(
+        "construct.arbitrary_1k",
+        _construct(lambda: st.Arbitrary(tuple(np.geomspace(20, 20e3, 1000)))),
+    ),
+    Benchmark(
+        "construct.harmonic_series_100",
+        _construct(lambda: st.HarmonicSeries("C", 100)),
+    ),
+    Benchmark(
+        "construct.harmonic_series_1m",
+        _construct(lambda: st.HarmonicSeries("C", HUGE)),
+        quick=False,
+    ),
+    Benchmark(
+        "construct.harmonic_octave_100",
+        _construct(lambda: st.HarmonicOctave("C", 100)),
+    ),
+    Benchmark(
+        "construct.harmonic_octave_1m",
+        _construct(lambda: st.HarmonicOctave("C", HUGE)),
+        quick=False,
+    ),
+    Benchmark("extend.chromatic_4", _extend(lambda: st.Chromatic("C"), 4)),
+    Benchmark(
+        "extend.harmonic_series_10k_2",
+        _extend(lambda: st.HarmonicSeries("C", 10_000), 2),
+    ),
+    Benchmark("geometry.spiral_scale_10k", _spiral_scale),
+    Benchmark("geometry.polar_coords_1m", _polar_coords, quick=False),
+    Benchmark("draw.major", _draw(lambda: (st.Major("C"),), 0)),
+    Benchmark(
+        "draw.chromatic_100_scales_4",
+        _draw(lambda: tuple(st.Chromatic(_KEYS[i % 7]) for i in range(100)), 4),
+    ),
+    Benchmark(
+        "draw.harmonic_series_100k_webgl",
+        _draw(
+            lambda: (st.HarmonicSeries("C", 100_000),), 0, render_mode="webgl"
+        ),
+        quick=False,
+    ),
+    Benchmark(
+        "draw.chromatic_8_decimated",
+        _draw(lambda: (st.Chromatic("C"),), 8, decimate=True),
+    ),
+    Benchmark("cache.figure_hit_100_scales_4", _cache_hit("draw")),
+    Benchmark("cache.json_hit_100_scales_4", _cache_hit("draw_json")),
+    Benchmark("export.svg_writer", _draw_svg),
+    Benchmark("export.json_writer_100_scales_4", _draw_json),
+    Benchmark("export.figure_to_json_100_scales_4", _to_json),
+    Benchmark("export.kaleido_png", _to_png),
+)
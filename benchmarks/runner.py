@@ -0,0 +1,136 @@
+"""Timing of benchmarks, and comparison of results against a baseline."""
+
+import datetime
+import json
+import platform
+import timeit
+from dataclasses import dataclass
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Iterable
+from .cases import Benchmark
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """The timing of one benchmark relative to its baseline.
+
+    Attributes:
+        name (str): the benchmark name
+        seconds (float): the time per call of this run
+        baseline (float | None): the baseline time per call, None if absent
+        threshold (float): the allowed relative change, e.g. 0.25 for 25%
+    """
+
+    name: str
+    seconds: float
+    baseline: float | None
+    threshold: float
+
+    @property
+    def ratio(self) -> float | None:
+        """This run's time over the baseline time, None without baseline."""
+        if self.baseline is None or self.baseline <= 0:
+            return None
+        return self.seconds / self.baseline
+
+    @property
+    def status(self) -> str:
+        """One of "new", "slower", "faster" or "same"."""
+        ratio = self.ratio
+        if ratio is None:
+            return "new"
+        if ratio > 1 + self.threshold:
+            return "slower"
+        if ratio < 1 / (1 + self.threshold):
+            return "faster"
+        return "same"
+
+
+def time_benchmark(benchmark: Benchmark, repeat: int) -> dict[str, Any]:
+    """Return the best time per call of a benchmark over repeated runs.
+
+    Each run makes as many calls as fit in about 0.2 s (at least one), as
+    timeit's autorange does, so fast workloads are timed in bulk.
+
+    Args:
+        benchmark (Benchmark): the workload to time
+        repeat (int): the number of runs
+
+    Returns:
+        dict with the seconds per call of the fastest run, and the numbers
+        of runs and calls per run
+    """
+    timer = timeit.Timer(benchmark.setup())
+    number, _ = timer.autorange()
+    times = timer.repeat(repeat=repeat, number=number)
+    return {
+        "seconds": min(times) / number,
+        "repeat": repeat,
+        "number": number,
+    }
+
+
+def environment() -> dict[str, str]:
+    """Return the versions and platform that the timings depend on."""
+    versions = {
+        package: _version(package)
+        for package in ("semitone", "numpy", "pandas", "plotly", "kaleido")
+    }
+    return {
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        **versions,
+    }
+
+
+def _version(package: str) -> str:
+    """Return the installed version of a package, or "" if not installed."""
+    try:
+        return metadata.version(package)
+    except metadata.PackageNotFoundError:
+        return ""
+
+
+def save(path: Path, results: dict[str, Any]) -> None:
+    """Write results as indented JSON, creating the directory if missing."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+
+
+def load(path: Path) -> dict[str, Any]:
+    """Read results from JSON; an empty record if the file is missing."""
+    if not path.is_file():
+        return {"environment": {}, "benchmarks": {}, "thresholds": {}}
+    return json.loads(path.read_text())
+
+
+def compare(
+    benchmarks: Iterable[tuple[str, float]],
+    baseline: dict[str, Any],
+    threshold: float,
+) -> list[Comparison]:
+    """Compare timings with a baseline record.
+
+    Args:
+        benchmarks (Iterable[tuple[str, float]]): names and seconds per call
+        baseline (dict): a record as written by save; its optional
+            "thresholds" mapping sets the threshold of named benchmarks
+        threshold (float): the allowed relative change of the others
+
+    Returns:
+        list of Comparison, one per benchmark
+    """
+    timings = baseline.get("benchmarks", {})
+    thresholds = baseline.get("thresholds", {})
+    return [
+        Comparison(
+            name,
+            seconds,
+            timings[name]["seconds"] if name in timings else None,
+            thresholds.get(name, threshold),
+        )
+        for name, seconds in benchmarks
+    ]
@@ -15,8 +15,17 @@ Main classes:
     Scale: A series of tones in a distinct order
     Major, Minor, Chromatic, ...: Specific scale types
     SpiralPlot: Graphical representation of scales as spiral plots
+
+Modules:
+    instrumentation: Timing, memory and profiling hooks for the pipeline
+
+The plotting classes are imported on first access, so scale-only code does not
+pay for loading plotly.
 """
 
+import importlib
+from typing import TYPE_CHECKING, Any
+from . import instrumentation
 from .scales.tone import Tone
 from .scales.scale import Scale
 from .scales.arbitrary import Arbitrary
@@ -25,11 +34,14 @@ from .scales.chromatic import Chromatic
 from .scales.diatonic_mode import DiatonicMode
 from .scales.major import Major
 from .scales.minor import Minor
-from .visuals.spiral_plot import SpiralPlot
 from .scales.just_tempered import JustTempered
 from .scales.harmonic_series import HarmonicSeries
 from .scales.harmonic_octave import HarmonicOctave
 
+if TYPE_CHECKING:
+    from . import visuals
+    from .visuals.spiral_plot import SpiralPlot
+
 __all__ = [
     "Tone",
     "Scale",
@@ -44,3 +56,23 @@ __all__ = [
     "HarmonicSeries",
     "HarmonicOctave",
 ]
+
+# Plotting pulls in plotly, so it is only imported on first use.
+_LAZY_EXPORTS = {
+    "visuals": ".visuals",
+    "SpiralPlot": ".visuals.spiral_plot",
+}
+
+
+def __getattr__(name: str) -> Any:  # pylint: disable=invalid-name
+    """Import the visuals subpackage and its exports on first access."""
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+    value = module if name == "visuals" else getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:  # pylint: disable=invalid-name
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
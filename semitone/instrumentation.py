@@ -0,0 +1,215 @@
+"""Instrumentation - timing and profiling of the semitone pipeline stages.
+
+Scale construction, Scale.extend, and the stages of SpiralPlot.draw,
+SpiralPlot.draw_svg and SpiralPlot.write_json each emit a StageEvent holding
+the wall time, the number of tones or points produced, and the peak memory
+allocated, if tracemalloc is tracing. Receive the events with a registered
+listener:
+    >>> from semitone import instrumentation
+    >>> instrumentation.add_listener(print)
+
+or collect them over a block, optionally with memory tracing and cProfile:
+    >>> with instrumentation.record(trace_memory=True, profile=True) as rec:
+    ...     fig = st.SpiralPlot.draw((st.Major("C"),))
+    >>> for event in rec.events: print(event.stage, event.seconds)
+    >>> rec.stats().sort_stats("cumulative").print_stats(10)
+
+Without listeners, stages cost only a check of the listener list.
+"""
+
+import cProfile
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from types import TracebackType
+from typing import Callable, Iterator
+
+
+@dataclass(frozen=True)
+class StageEvent:
+    """The measurements of one run of a pipeline stage.
+
+    Attributes:
+        stage (str): the stage, e.g. "Scale.extend" or "SpiralPlot.decimate"
+        detail (str): what the stage ran on, e.g. the Scale class name
+        seconds (float): the wall time
+        points (int): the number of tones or plot points produced
+        peak_bytes (int | None): the peak memory allocated during the stage,
+            above that at its start; None unless tracemalloc is tracing
+    """
+
+    stage: str
+    detail: str
+    seconds: float
+    points: int
+    peak_bytes: int | None
+
+
+Listener = Callable[[StageEvent], None]
+
+_listeners: list[Listener] = []
+_memory = threading.local()  # per thread: stack of [start, peak] of stages
+
+
+def add_listener(listener: Listener) -> None:
+    """Call listener with the StageEvent of every stage from now on."""
+    _listeners.append(listener)
+
+
+def remove_listener(listener: Listener) -> None:
+    """Stop calling a listener added by add_listener.
+
+    Raises:
+        ValueError: if the listener is not registered
+    """
+    _listeners.remove(listener)
+
+
+@dataclass
+class Recording:
+    """The StageEvents collected by record, and its optional profile.
+
+    Attributes:
+        events (list[StageEvent]): the events, in the order the stages ended
+        profile (cProfile.Profile | None): the profile of the recorded block,
+            None unless recorded with profile=True
+    """
+
+    events: list[StageEvent] = field(default_factory=list)
+    profile: cProfile.Profile | None = None
+
+    def stats(self) -> pstats.Stats:
+        """Return the profile statistics of the recorded block.
+
+        Raises:
+            ValueError: if the block was not recorded with profile=True
+        """
+        if self.profile is None:
+            raise ValueError("record(profile=True) to capture a profile")
+        return pstats.Stats(self.profile)
+
+
+@contextmanager
+def record(
+    trace_memory: bool = False, profile: bool = False
+) -> Iterator[Recording]:
+    """Collect the StageEvents emitted within a block.
+
+    Args:
+        trace_memory (bool): if True, trace allocations with tracemalloc
+            during the block, so the events carry peak_bytes; tracing slows
+            the code down severalfold
+        profile (bool): if True, also profile the block with cProfile
+
+    Yields:
+        the Recording, filled in as the stages end
+    """
+    recording = Recording()
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    add_listener(recording.events.append)
+    if profile:
+        recording.profile = cProfile.Profile()
+        recording.profile.enable()
+    try:
+        yield recording
+    finally:
+        if recording.profile is not None:
+            recording.profile.disable()
+        remove_listener(recording.events.append)
+        if started_tracing:
+            tracemalloc.stop()
+
+
+def stage(name: str, detail: str = "") -> "_Stage":
+    """Return a context manager measuring one run of a stage.
+
+    The StageEvent is emitted to the listeners when the block ends, unless
+    it raises. Set the points attribute within the block to report the
+    output size:
+        with instrumentation.stage("Scale.extend") as measured:
+            ...
+            measured.points = len(freqs)
+
+    Args:
+        name (str): the stage name, see StageEvent
+        detail (str): what the stage runs on, see StageEvent
+    """
+    return _Stage(name, detail)
+
+
+class _Stage:
+    """The context manager returned by stage."""
+
+    __slots__ = ("name", "detail", "points", "_start", "_active", "_traced")
+
+    def __init__(self, name: str, detail: str) -> None:
+        self.name = name
+        self.detail = detail
+        self.points = 0
+        self._start = 0.0
+        self._active = False
+        self._traced = False
+
+    def __enter__(self) -> "_Stage":
+        self._active = bool(_listeners)
+        if self._active:
+            self._traced = tracemalloc.is_tracing()
+            if self._traced:
+                _push_memory_frame()
+            self._start = time.perf_counter()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if not self._active:
+            return
+        seconds = time.perf_counter() - self._start
+        peak_bytes = _pop_memory_frame() if self._traced else None
+        if exc_type is not None:
+            return
+        event = StageEvent(
+            self.name, self.detail, seconds, self.points, peak_bytes
+        )
+        for listener in tuple(_listeners):
+            listener(event)
+
+
+def _push_memory_frame() -> None:
+    """Start measuring the peak allocation of a stage, maybe nested.
+
+    tracemalloc has one peak, so it is folded into the enclosing stage's
+    frame before being reset for this one.
+    """
+    if not hasattr(_memory, "frames"):
+        _memory.frames = []
+    frames = _memory.frames
+    current, peak = tracemalloc.get_traced_memory()
+    if frames:
+        frames[-1][1] = max(frames[-1][1], peak)
+    tracemalloc.reset_peak()
+    frames.append([current, current])
+
+
+def _pop_memory_frame() -> int | None:
+    """Return the peak allocation of the innermost stage, above its start.
+
+    Returns None if tracing stopped during the stage.
+    """
+    start, peak = _memory.frames.pop()
+    if not tracemalloc.is_tracing():
+        return None
+    peak = max(peak, tracemalloc.get_traced_memory()[1])
+    frames = _memory.frames
+    if frames:
+        frames[-1][1] = max(frames[-1][1], peak)
+    tracemalloc.reset_peak()
+    return peak - start
@@ -0,0 +1,18 @@
+"""InstrumentedScaleType: Scale construction as an instrumentation stage."""
+
+from typing import Any
+from .. import instrumentation
+
+
+class InstrumentedScaleType(type):
+    """Metaclass of Scale, emitting a "Scale.construct" stage per instance.
+
+    The event detail is the class name, and its points the number of
+    primaries; see semitone.instrumentation.
+    """
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        with instrumentation.stage("Scale.construct", cls.__name__) as measured:
+            scale = super().__call__(*args, **kwargs)
+            measured.points = len(scale.frequencies)
+        return scale
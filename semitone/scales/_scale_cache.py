@@ -0,0 +1,53 @@
+"""MemoizedScaleType: shared, frozen Scale instances."""
+
+import functools
+from typing import Any
+from ._instrumented_type import InstrumentedScaleType
+
+
+class MemoizedScaleType(InstrumentedScaleType):
+    """Metaclass for Scales fully determined by their constructor arguments.
+
+    Calling a class with this metaclass, e.g. Major("C"), returns a frozen
+    instance shared by all calls with the same arguments. Instances are held
+    in a bounded LRU cache shared by all such classes; see cache_info and
+    cache_clear. Calls with unhashable arguments build a new instance.
+    Only constructions, not cache hits, emit "Scale.construct" stages.
+    """
+
+    CACHE_SIZE = 256  # maximum number of shared instances
+
+    def __call__(cls, *args: Any, **kwargs: Any) -> Any:
+        key = (cls, args, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return _build_frozen(*key)
+        return _build_frozen_cached(*key)
+
+    def cache_info(cls) -> Any:
+        """Return the hits, misses, maxsize and currsize of the shared cache.
+
+        The statistics cover every class using this metaclass.
+        """
+        return _build_frozen_cached.cache_info()
+
+    def cache_clear(cls) -> None:
+        """Empty the shared cache and reset its statistics."""
+        _build_frozen_cached.cache_clear()
+
+
+def _build_frozen(
+    cls: MemoizedScaleType,
+    args: tuple[Any, ...],
+    kwargs: tuple[tuple[str, Any], ...],
+) -> Any:
+    """Construct and freeze an instance of cls."""
+    scale = InstrumentedScaleType.__call__(cls, *args, **dict(kwargs))
+    scale.freeze()
+    return scale
+
+
+_build_frozen_cached = functools.lru_cache(
+    maxsize=MemoizedScaleType.CACHE_SIZE
+)(_build_frozen)
@@ -1,5 +1,6 @@
 """Arbitrary: a scale of any tones."""
 
+import numpy as np
 from . import Tone, Scale
 
 
@@ -17,4 +18,4 @@ class Arbitrary(Scale):
         self.principle = Tone(frequencies[0])
         self.key_name = f"{self.principle.freq:.2f} Hz"
         self.scale_name = "arb"
-        self.primaries = tuple(Tone(freq) for freq in sorted(frequencies))
+        self.frequencies = np.sort(np.array(frequencies, dtype=np.float64))
@@ -1,6 +1,6 @@
 """Chromatic: an equal-tempered scale."""
 
-from . import Tone, EqualTempered
+from . import EqualTempered
 
 
 class Chromatic(EqualTempered):
@@ -10,10 +10,10 @@ class Chromatic(EqualTempered):
         """Initialize. See args for EqualTempered."""
         super().__init__(key_name)
         self.scale_name = f"{key_name} chrom"
-        self.primaries = tuple(
-            Tone(self.ith_freq_from_primary(self.principle.freq, i))
+        self.frequencies = [
+            self.ith_freq_from_primary(self.principle.freq, i)
             for i in range(12)
-        )
+        ]
 
     def note_names(self) -> tuple[str, ...]:
         """Return 12 note names, rising, starting from the key principle"""
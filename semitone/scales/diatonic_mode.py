@@ -1,6 +1,6 @@
 """DiatonicMode: an equal-tempered scale."""
 
-from . import Tone, EqualTempered
+from . import EqualTempered
 
 
 class DiatonicMode(EqualTempered):
@@ -28,10 +28,10 @@ class DiatonicMode(EqualTempered):
             raise ValueError("mode must be an int 1-7, inclusive")
 
         self.scale_name = f"{key_name} {DiatonicMode._MODE_NAMES[mode-1]}"
-        self.primaries = tuple(
-            Tone(self.ith_freq_from_primary(self.principle.freq, i))
+        self.frequencies = [
+            self.ith_freq_from_primary(self.principle.freq, i)
             for i in self.steps_from_mode(mode)
-        )
+        ]
 
     @staticmethod
     def steps_from_mode(mode: int) -> tuple[int, ...]:
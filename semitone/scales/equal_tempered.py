@@ -1,14 +1,54 @@
 """EqualTempered: a scale on a grid."""
 
+import functools
+import re
+from typing import Iterable, NamedTuple, Sequence
+import numpy as np
 from . import Tone, Scale
+from ._scale_cache import MemoizedScaleType
 
 
-class EqualTempered(Scale):
+class NoteSpelling(NamedTuple):
+    """Nearest equal-tempered notes of a series of frequencies.
+
+    Attributes:
+        names (numpy.ndarray): note names, e.g. 'Db', one per frequency
+        octaves (numpy.ndarray): octave numbers in scientific pitch notation
+        cents (numpy.ndarray): signed offsets from the named notes in cents
+    """
+
+    names: np.ndarray
+    octaves: np.ndarray
+    cents: np.ndarray
+
+    def pitches(self, decimals: int = 1) -> tuple[str, ...]:
+        """Return the notes in scientific pitch notation, e.g. 'A4+13.0c'.
+
+        The strings can be read back with EqualTempered.freq_from_pitch.
+
+        Args:
+            decimals (int): digits of the cents offsets to keep; default=1
+        """
+        # adding 0.0 turns a rounded -0.0 into 0.0, to print +0c not -0c
+        return tuple(
+            f"{name}{octave}{round(cents, decimals) + 0.0:+.{decimals}f}c"
+            for name, octave, cents in zip(
+                self.names.tolist(), self.octaves.tolist(), self.cents.tolist()
+            )
+        )
+
+
+class EqualTempered(Scale, metaclass=MemoizedScaleType):
     """Tones from the traditional tuning of a piano.
 
     The frequencies live on a grid equally-spaced in log frequency,
     with 12 pitches (aka semitones) between each octave. The grid is
     referenced to international standard pitch, A4=440 Hz.
+
+    Equal-tempered scales are fully determined by their constructor arguments,
+    so construction is memoized: e.g. Major("C") returns the same frozen
+    instance on every call. See MemoizedScaleType for the cache controls,
+    e.g. EqualTempered.cache_info() and EqualTempered.cache_clear().
     """
 
     _SPELLINGS = (
@@ -26,6 +66,22 @@ class EqualTempered(Scale):
         ("B",),
     )
 
+    # lookup tables built once from the spellings
+    _CHROMATIC_INDICES = {
+        name: i
+        for i, enharmonics in enumerate(_SPELLINGS)
+        for name in enharmonics
+    }
+    _FREQS_OCTAVE_4 = tuple(
+        Scale._A440 * pow(2, -9 / 12) * pow(2, i / 12) for i in range(12)
+    )
+
+    # scientific pitch notation, e.g. C#5, Bb-1, A4+13c
+    _PITCH_PATTERN = re.compile(
+        r"(?P<name>[A-G][#b]?)(?P<octave>-?\d+)?"
+        r"(?:(?P<cents>[+-]\d+(?:\.\d*)?)c)?"
+    )
+
     def __init__(self, key_name: str) -> None:
         """Initialize
 
@@ -50,6 +106,45 @@ class EqualTempered(Scale):
         above = self._SPELLINGS[offset:]
         return tuple("/".join(enharmonics) for enharmonics in above + below)
 
+    def spell(self, frequencies: Sequence[float] | np.ndarray) -> NoteSpelling:
+        """Name the nearest equal-tempered note of each of many frequencies.
+
+        Works for frequencies from any tuning system, e.g. the frequencies of
+        a JustTempered scale, and converts the whole array in one pass.
+
+        Enharmonic notes are spelled to suit the key of this scale: with
+        sharps in the sharp keys (G, D, A, E, B and any key named with a #),
+        and with flats otherwise.
+
+        Args:
+            frequencies (numpy.ndarray): the frequencies in Hz
+
+        Returns:
+            a NoteSpelling of note names, octaves and cents offsets, one
+            element each per frequency
+        """
+        offset = self.find_chromatic_index(self.key_name)
+        spelling = -1 if self._prefers_sharps(self.key_name) else 0
+        names_from_key = np.array(
+            [
+                enharmonics.split("/")[spelling]
+                for enharmonics in self.note_names_including_enharmonics()
+            ]
+        )
+        freqs = np.asarray(frequencies, dtype=np.float64)
+        semitones = 12 * np.log2(freqs / self._FREQS_OCTAVE_4[0])
+        nearest = np.rint(semitones).astype(np.int64)
+        return NoteSpelling(
+            names=names_from_key[(nearest - offset) % 12],
+            octaves=4 + nearest // 12,
+            cents=100 * (semitones - nearest),
+        )
+
+    @staticmethod
+    def _prefers_sharps(key_name: str) -> bool:
+        """True if notes in the key are traditionally spelled with sharps."""
+        return "#" in key_name or key_name in ("G", "D", "A", "E", "B")
+
     @staticmethod
     def ith_freq_from_primary(key_center: float, i: int) -> float:
         """Compute the frequency i semitones above the given key center.
@@ -78,11 +173,46 @@ class EqualTempered(Scale):
                 approximately 262-523 Hz; default=4
         """
         index = EqualTempered.find_chromatic_index(name)
-        freq_c4 = EqualTempered.ith_freq_from_primary(Scale._A440, -9)
-        frequencies = tuple(
-            EqualTempered.ith_freq_from_primary(freq_c4, i) for i in range(12)
+        return EqualTempered._FREQS_OCTAVE_4[index] * 2 ** (octave - 4)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def freq_from_pitch(pitch: str) -> float:
+        """Lookup the frequency of a note in scientific pitch notation.
+
+        Args:
+            pitch (str): a note name, optionally followed by an octave number
+                (default 4) and a signed offset in cents ending in c; e.g.
+                C#5, Bb-1, A4+13c, Eb-20.5c
+
+        Returns:
+            the frequency in Hz (float)
+        """
+        match = EqualTempered._PITCH_PATTERN.fullmatch(pitch)
+        if match is None:
+            raise ValueError(f"{pitch} is not in scientific pitch notation")
+        octave = int(match["octave"] or 4)
+        cents = float(match["cents"] or 0)
+        freq = EqualTempered.freq_from_name(match["name"], octave)
+        return freq * 2 ** (cents / 1200)
+
+    @staticmethod
+    def freqs_from_names(names: Iterable[str]) -> np.ndarray:
+        """Lookup the frequencies of many notes in scientific pitch notation.
+
+        Repeated names are parsed only once, so long note lists built from a
+        small vocabulary of names convert quickly.
+
+        Args:
+            names (Iterable[str]): the notes, see freq_from_pitch
+
+        Returns:
+            a float64 numpy.ndarray of frequencies in Hz, one per name
+        """
+        return np.fromiter(
+            (EqualTempered.freq_from_pitch(name) for name in names),
+            dtype=np.float64,
         )
-        return frequencies[index] * 2 ** (octave - 4)
 
     @staticmethod
     def find_chromatic_index(name: str) -> int:
@@ -90,10 +220,9 @@ class EqualTempered(Scale):
 
         E.g. C is 0, C# and Db are 1, D is 2, ... B is 11
         """
-        for i, enharmonics in enumerate(EqualTempered._SPELLINGS):
-            if name in enharmonics:
-                index = i
-                break
-        else:
-            raise ValueError(f"Name {name} is not an equal-tempered note name")
-        return index
+        try:
+            return EqualTempered._CHROMATIC_INDICES[name]
+        except KeyError as error:
+            raise ValueError(
+                f"Name {name} is not an equal-tempered note name"
+            ) from error
@@ -1,6 +1,6 @@
 """HarmonicOctave: a just-tempered scale"""
 
-from fractions import Fraction
+import numpy as np
 from . import JustTempered
 
 
@@ -23,21 +23,27 @@ class HarmonicOctave(JustTempered):
         """
         super().__init__(key_name)
         self.scale_name = f"{key_name} harm"
-        ratios = self._unique_reduced_ratios(max_multiplier)
-        self.primaries = tuple(self._tone_from_freq_ratio(r) for r in ratios)
-
-    def _reduced_ratio(self, n: int) -> Fraction:
-        """Reduce integer n into the interval [1, 2) by dividing by 2."""
-        ratio = Fraction(n)
-        while ratio >= 2:
-            ratio /= 2
-        return ratio
-
-    def _unique_reduced_ratios(self, max_multiplier: int):
-        """Return a sorted list of unique reduced ratios for 1..max_multiplier.
-
-        Uses a set to deduplicate ratios (Fraction is hashable) and returns
-        them in ascending order.
+        self._set_ratios(*self._unique_reduced_ratios(max_multiplier))
+
+    @staticmethod
+    def _unique_reduced_ratios(
+        max_multiplier: int,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return the sorted unique reduced ratios for 1..max_multiplier.
+
+        Each n is its odd part m times a power of 2, and reduces into the
+        interval [1, 2) as m / 2**floor(log2(m)). Reduced ratios are equal
+        exactly when odd parts are equal, and the odd parts of 1..max are the
+        odd numbers up to max, so those are reduced with a single exponent
+        shift each, with no Fractions and no deduplication.
+
+        Returns:
+            a 2-tuple of int64 arrays (numerators, denominators) of the ratios,
+            in ascending order of ratio
         """
-        ratios = {self._reduced_ratio(n) for n in range(1, max_multiplier + 1)}
-        return sorted(ratios)
+        odd_parts = np.arange(1, max_multiplier + 1, 2, dtype=np.int64)
+        # m = mantissa * 2**exponent with mantissa in [0.5, 1)
+        _, exponents = np.frexp(odd_parts)
+        denominators = np.left_shift(1, exponents.astype(np.int64) - 1)
+        order = np.argsort(odd_parts / denominators)
+        return odd_parts[order], denominators[order]
@@ -1,15 +1,22 @@
 """HarmonicSeries: a just-tempered scale"""
 
-from fractions import Fraction
-from . import JustTempered
+import math
+from typing import Iterator
+import numpy as np
+from . import EqualTempered, JustTempered
 
 
 class HarmonicSeries(JustTempered):
     """The harmonic scale built by multiplying a frequency by 2, 3, 4, ...
 
     Note, this scale spans multiple octaves.
+
+    For very long series, HarmonicSeries.iter_frequency_chunks streams the
+    frequencies in fixed-size arrays instead of building the whole scale.
     """
 
+    CHUNK_SIZE = 65536  # default number of harmonics per streamed chunk
+
     def __init__(self, key_name: str, max_multiplier: int) -> None:
         """Initialize. See args for JustTempered, plus max below.
 
@@ -20,9 +27,52 @@ class HarmonicSeries(JustTempered):
         """
         super().__init__(key_name)
         self.scale_name = f"{key_name} harm ser"
-        ratios = self._harmonic_ratios(max_multiplier)
-        self.primaries = tuple(self._tone_from_freq_ratio(r) for r in ratios)
+        multipliers = np.arange(1, max_multiplier + 1, dtype=np.int64)
+        self._set_ratios(multipliers, np.ones_like(multipliers))
+
+    @staticmethod
+    def iter_frequency_chunks(
+        key_name: str,
+        max_multiplier: int | None = None,
+        max_freq: float | None = None,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> Iterator[np.ndarray]:
+        """Yield the frequencies of the harmonic series in fixed-size chunks.
+
+        Only one chunk is held in memory at a time, so the series may be far
+        longer than would fit in a HarmonicSeries; the chunks together hold
+        the same frequencies as HarmonicSeries(key_name, max_multiplier).
 
-    def _harmonic_ratios(self, max_multiplier: int):
-        """Return a list of the harmonic ratios for 1..max_multiplier."""
-        return [Fraction(n) for n in range(1, max_multiplier + 1)]
+        Args:
+            key_name (str): the name of the principle, see JustTempered
+            max_multiplier (int): the last harmonic to include; default is no
+                limit
+            max_freq (float): the highest frequency in Hz to include; default
+                is no limit; with neither limit the generator never finishes
+            chunk_size (int): the number of harmonics per chunk, the last
+                chunk may be shorter
+
+        Yields:
+            float64 numpy.ndarrays of rising frequencies in Hz
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive int")
+        principle = EqualTempered.freq_from_name(key_name)
+        last = max_multiplier
+        if max_freq is not None:
+            last_below_max_freq = math.floor(max_freq / principle)
+            # the division may round down just below a whole multiple
+            if principle * (last_below_max_freq + 1) <= max_freq:
+                last_below_max_freq += 1
+            last = (
+                last_below_max_freq
+                if last is None
+                else min(last, last_below_max_freq)
+            )
+        start = 1
+        while last is None or start <= last:
+            stop = start + chunk_size
+            if last is not None:
+                stop = min(stop, last + 1)
+            yield principle * np.arange(start, stop, dtype=np.float64)
+            start = stop
@@ -1,6 +1,8 @@
 """JustTempered: a scale of perfect ratios."""
 
 from fractions import Fraction
+from typing import Sequence
+import numpy as np
 from . import Tone, Scale, EqualTempered
 
 
@@ -8,6 +10,12 @@ class JustTempered(Scale):
     """Tones from the just temperament tuning system.
 
     The frequencies are all perfect ratios of a single base frequency.
+
+    The exact ratios of the primaries to the principle are kept in lowest
+    terms as paired int64 arrays, numerators and denominators, and are also
+    available as Fractions via ratios. Scales derived by extend or
+    tones_between keep exact ratios too; when shifting by many octaves would
+    overflow int64, the arrays hold Python ints instead (dtype object).
     """
 
     def __init__(self, key_name: str) -> None:
@@ -21,16 +29,111 @@ class JustTempered(Scale):
         super().__init__()
         self.key_name = key_name
         self.principle = Tone(EqualTempered.freq_from_name(self.key_name))
+        no_ratios = np.ones(0, dtype=np.int64)
+        self._set_ratios(no_ratios, no_ratios)
 
-    def _tone_from_freq_ratio(self, ratio: Fraction) -> Tone:
-        """Compute the Tone given a perfect ratio of the key center's freq.
+    @property
+    def frequencies(self) -> np.ndarray:
+        """The primary frequencies in Hz, as a read-only float64 array.
 
-        Args:
-            ratio (Fraction): the perfect ratio of the key center to compute
-                the frequency of, e.g. Fraction(3, 2) for a perfect fifth;
-                a fraction less than 1 means lower tone than the key center
+        They follow the exact ratios, so unlike other scales they may not be
+        set, nor may the primaries, which would leave the ratios stale; build
+        an Arbitrary scale of free frequencies instead.
+        """
+        return self._frequencies
+
+    @frequencies.setter
+    def frequencies(self, values: Sequence[float] | np.ndarray) -> None:
+        # only Scale.__init__ sets them, before the ratios exist
+        if "_numerators" in vars(self):
+            raise AttributeError(
+                f"cannot assign frequencies of {type(self).__name__}, which "
+                "follow its exact ratios; use Arbitrary for free frequencies"
+            )
+        self._set_frequencies(values)
+
+    @property
+    def numerators(self) -> np.ndarray:
+        """The numerators of the primaries' ratios, as a read-only array."""
+        return self._numerators
+
+    @property
+    def denominators(self) -> np.ndarray:
+        """The denominators of the primaries' ratios, as a read-only array."""
+        return self._denominators
 
-        Returns:
-            the Tone with the computed frequency
+    @property
+    def ratios(self) -> tuple[Fraction, ...]:
+        """The exact ratios of the primaries, created on demand."""
+        return tuple(
+            Fraction(numerator, denominator)
+            for numerator, denominator in zip(
+                self._numerators.tolist(), self._denominators.tolist()
+            )
+        )
+
+    def _set_ratios(
+        self, numerators: np.ndarray, denominators: np.ndarray
+    ) -> None:
+        """Set the primaries to perfect ratios of the key center's frequency.
+
+        Args:
+            numerators, denominators (numpy.ndarray): int arrays of equal
+                length, with positive denominators; e.g. ([3], [2]) for a
+                perfect fifth; a ratio less than 1 means lower tone than the
+                key center
         """
-        return Tone(self.principle.freq * float(ratio))
+        numerators, denominators = self._reduce_ratios(
+            np.asarray(numerators, dtype=np.int64),
+            np.asarray(denominators, dtype=np.int64),
+        )
+        self._numerators = numerators
+        self._denominators = denominators
+        self._set_frequencies(self.principle.freq * numerators / denominators)
+
+    def _with_octave_shifts(
+        self, freqs: np.ndarray, indices: np.ndarray, octaves: np.ndarray
+    ) -> Scale:
+        """See Scale._with_octave_shifts; also shifts the exact ratios."""
+        new_scale = super()._with_octave_shifts(freqs, indices, octaves)
+        numerators = self._numerators[indices]
+        denominators = self._denominators[indices]
+        ups, downs = np.maximum(octaves, 0), np.maximum(-octaves, 0)
+        if not (
+            self._shift_fits_int64(numerators, ups)
+            and self._shift_fits_int64(denominators, downs)
+        ):
+            numerators, denominators = (
+                numerators.astype(object),
+                denominators.astype(object),
+            )
+            ups, downs = ups.astype(object), downs.astype(object)
+        numerators, denominators = self._reduce_ratios(
+            np.left_shift(numerators, ups), np.left_shift(denominators, downs)
+        )
+        # bypass __setattr__, which would refuse if this Scale is frozen
+        vars(new_scale).update(
+            _numerators=numerators, _denominators=denominators
+        )
+        return new_scale
+
+    @staticmethod
+    def _shift_fits_int64(values: np.ndarray, shifts: np.ndarray) -> bool:
+        """True if shifting the positive values left cannot overflow int64."""
+        if values.size == 0:
+            return True
+        return int(values.max()).bit_length() + int(shifts.max()) < 63
+
+    @staticmethod
+    def _reduce_ratios(
+        numerators: np.ndarray, denominators: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return the ratios in lowest terms, as read-only arrays."""
+        if np.any(denominators <= 0):
+            raise ValueError("ratio denominators must be positive")
+        divisors = np.gcd(numerators, denominators)
+        numerators = numerators // divisors
+        denominators = denominators // divisors
+        numerators.flags.writeable = False
+        denominators.flags.writeable = False
+        return numerators, denominators
@@ -1,6 +1,6 @@
 """Major: an equal-tempered scale."""
 
-from . import Tone, EqualTempered
+from . import EqualTempered
 
 
 class Major(EqualTempered):
@@ -10,7 +10,7 @@ class Major(EqualTempered):
         """Initialize. See args for EqualTempered."""
         super().__init__(key_name)
         self.scale_name = f"{key_name} ma"
-        self.primaries = tuple(
-            Tone(self.ith_freq_from_primary(self.principle.freq, i))
+        self.frequencies = [
+            self.ith_freq_from_primary(self.principle.freq, i)
             for i in (0, 2, 4, 5, 7, 9, 11)
-        )
+        ]
@@ -1,6 +1,6 @@
 """Minor: an equal-tempered scale."""
 
-from . import Tone, EqualTempered
+from . import EqualTempered
 
 
 class Minor(EqualTempered):
@@ -10,7 +10,7 @@ class Minor(EqualTempered):
         """Initialize. See args for EqualTempered."""
         super().__init__(key_name)
         self.scale_name = f"{key_name} mi"
-        self.primaries = tuple(
-            Tone(self.ith_freq_from_primary(self.principle.freq, i))
+        self.frequencies = [
+            self.ith_freq_from_primary(self.principle.freq, i)
             for i in (0, 2, 3, 5, 7, 8, 10)
-        )
+        ]
@@ -1,14 +1,27 @@
 """Scale: the base of the hierarchy."""
 
-from copy import deepcopy
+import math
+from copy import copy
+from numbers import Real
+from typing import Any, Iterator, Sequence
+import numpy as np
 from . import Tone
+from .. import instrumentation
+from ._instrumented_type import InstrumentedScaleType
 
 
-class Scale:
+class Scale(metaclass=InstrumentedScaleType):
     """A series of tones in a distinct order.
 
     Typical usage of x = Scale() includes print(x), which displays the
     primary frequencies in Hz.
+
+    The primary frequencies are stored in a single contiguous float64 array,
+    available as x.frequencies. Tone objects are only created when the
+    primaries are requested, via x.primaries.
+
+    After x.freeze() the Scale is immutable, so it may be shared freely;
+    scales derived from it, e.g. by extend, are frozen too.
     """
 
     _A440 = 440  # reference wrt to int'l standard pitch, A4=440 Hz, aka A440
@@ -16,11 +29,70 @@ class Scale:
     def __init__(self) -> None:
         self.key_name: str = ""
         self.scale_name: str = ""
-        self.primaries: tuple[Tone, ...] = ()
+        self.frequencies = ()
         self.principle: Tone = Tone(0.0)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self.frozen:
+            raise AttributeError(
+                f"cannot assign {name} of frozen {type(self).__name__}"
+            )
+        super().__setattr__(name, value)
+
+    @property
+    def frozen(self) -> bool:
+        """True if the Scale is immutable; see freeze."""
+        return self.__dict__.get("_frozen", False)
+
+    def freeze(self) -> None:
+        """Make the Scale immutable, so that assigning attributes fails."""
+        self.__dict__["_frozen"] = True
+
+    @property
+    def frequencies(self) -> np.ndarray:
+        """The primary frequencies in Hz, as a read-only float64 array."""
+        return self._frequencies
+
+    @frequencies.setter
+    def frequencies(self, values: Sequence[float] | np.ndarray) -> None:
+        self._set_frequencies(values)
+
+    def _set_frequencies(self, values: Sequence[float] | np.ndarray) -> None:
+        """Store a read-only float64 copy of the primary frequencies."""
+        freqs = np.array(values, dtype=np.float64)
+        freqs.flags.writeable = False
+        self._frequencies = freqs
+        self._index: tuple[np.ndarray, np.ndarray] | None = None
+
+    @property
+    def primaries(self) -> tuple[Tone, ...]:
+        """The primary Tones, created on demand from the frequencies."""
+        return tuple(Tone(freq) for freq in self._frequencies.tolist())
+
+    @primaries.setter
+    def primaries(self, tones: Sequence[Tone]) -> None:
+        self.frequencies = [tone.freq for tone in tones]
+
+    def buckets(self) -> np.ndarray:
+        """Return the tolerance bucket of each primary, as Tone.bucket.
+
+        Scales whose frequencies match within Tone.DELTA_CENTS have equal
+        buckets, except in the rare case a pair straddles a bucket edge;
+        useful as a content key for caching.
+
+        Returns:
+            int64 numpy.ndarray, one bucket per primary
+        """
+        with np.errstate(divide="ignore"):
+            cents = self._cents_from_freqs(self._frequencies)
+        finite = np.isfinite(cents)
+        buckets = np.floor(
+            np.where(finite, cents, 0.0) / Tone.DELTA_CENTS + 0.5
+        ).astype(np.int64)
+        return np.where(finite, buckets, np.where(cents < 0, -1, 1))
+
     def __str__(self) -> str:
-        return ", ".join([f"{tone}" for tone in self.primaries])
+        return ", ".join([f"{freq:.2f}" for freq in self._frequencies.tolist()])
 
     def __repr__(self) -> str:
         return str(self)
@@ -32,31 +104,284 @@ class Scale:
         """
         if not isinstance(other, Scale):
             return NotImplemented
-        if len(self.primaries) != len(other.primaries):
+        if self._frequencies.shape != other.frequencies.shape:
+            return False
+        diffs = 1200 * np.abs(np.log2(other.frequencies / self._frequencies))
+        return bool(np.all(diffs < Tone.DELTA_CENTS))
+
+    def __contains__(self, item: object) -> bool:
+        """True if a Tone, or frequency in Hz, is a primary of the Scale.
+
+        For tolerance, see Tone.__eq__.
+        """
+        if isinstance(item, Tone):
+            item = item.freq
+        if not isinstance(item, Real) or len(self._frequencies) == 0:
             return False
-        for t1, t2 in zip(self.primaries, other.primaries):
-            if not t1 == t2:
-                return False
-        return True
+        _, deviation = self.nearest(float(item))
+        return abs(deviation) < Tone.DELTA_CENTS
+
+    def nearest(self, freq: float) -> tuple[int, float]:
+        """Find the primary tone nearest in pitch to a frequency.
+
+        Args:
+            freq (float): the frequency in Hz to look up
+
+        Returns:
+            a 2-tuple of the index of the nearest tone in primaries (int), and
+            the signed deviation of freq from that tone in cents (float)
+        """
+        indices, deviations = self.nearest_many((freq,))
+        return int(indices[0]), float(deviations[0])
+
+    def nearest_many(
+        self, freqs: Sequence[float] | np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Find the primary tones nearest in pitch to many frequencies.
+
+        Each lookup is a binary search of a sorted index of the primaries,
+        which is built on first use and cached; all lookups run together.
+
+        Args:
+            freqs (numpy.ndarray): the frequencies in Hz to look up
+
+        Returns:
+            a 2-tuple of arrays, one element each per input frequency: the
+            indices of the nearest tones in primaries (int), and the signed
+            deviations of the frequencies from those tones in cents (float)
+        """
+        if len(self._frequencies) == 0:
+            raise ValueError("an empty Scale has no nearest tone")
+        sorted_cents, order = self._sorted_index()
+        cents = self._cents_from_freqs(np.asarray(freqs, dtype=np.float64))
+        above = np.searchsorted(sorted_cents, cents)
+        below = np.maximum(above - 1, 0)
+        above = np.minimum(above, len(sorted_cents) - 1)
+        deviations_below = cents - sorted_cents[below]
+        deviations_above = cents - sorted_cents[above]
+        use_above = np.abs(deviations_above) < np.abs(deviations_below)
+        nearest = np.where(use_above, above, below)
+        deviations = np.where(use_above, deviations_above, deviations_below)
+        return order[nearest], deviations
+
+    def _sorted_index(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return the primaries sorted by pitch, building them on first use.
+
+        Returns:
+            a 2-tuple of arrays: the sorted pitches in cents, and for each of
+            those the index of its tone in primaries
+        """
+        index = self._index
+        if index is None:
+            cents = self._cents_from_freqs(self._frequencies)
+            order = np.argsort(cents, kind="stable")
+            index = (cents[order], order)
+            # a cache, so it is stored even on a frozen Scale
+            self.__dict__["_index"] = index
+        return index
 
-    def extend(self, octaves_below: int, octaves_above: int) -> "Scale":
+    @staticmethod
+    def _cents_from_freqs(freqs: np.ndarray) -> np.ndarray:
+        """Convert frequencies in Hz to cents relative to A440."""
+        return 1200 * np.log2(freqs / Scale._A440)
+
+    @staticmethod
+    def pitch_class_matrix(scale_1: "Scale", scale_2: "Scale") -> np.ndarray:
+        """Compare the pitch classes of all primaries of two Scales at once.
+
+        Vectorized equivalent of calling Tone.same_pitch_class for every pair
+        of primaries, e.g. to find the notes two scales share.
+
+        Args:
+            scale_1, scale_2 (Scale): the Scales to compare
+
+        Returns:
+            a boolean numpy.ndarray of shape (len(freqs_1), len(freqs_2)),
+            True where primary i of scale_1 and primary j of scale_2 are any
+            n octaves apart
+        """
+        octaves_1 = np.log2(scale_1.frequencies)
+        octaves_2 = np.log2(scale_2.frequencies)
+        reduced = 1200 * np.mod(octaves_1[:, None] - octaves_2[None, :], 1)
+        return np.minimum(reduced, 1200 - reduced) < Tone.DELTA_CENTS
+
+    def extend(
+        self, octaves_below: int, octaves_above: int, unique: bool = False
+    ) -> "Scale":
         """Return the Scale extended to additional octaves
 
         Extends each primary tone independently into the given octave above
         and/or below that tone. Thus for scales with primaries spanning
         multiple octaves, this method intermixes new tones into the original
-        range of primaries, and may add duplicate tones.
+        range of primaries, and may add duplicate tones. Pass unique=True to
+        sort the result and drop such duplicates.
+
+        The returned Scale shares all metadata (names, principle) with this
+        one; only its frequencies differ.
 
         Args:
             octaves_below, octaves_above (int): how many octaves to extend
                 each primary tone
+            unique (bool): if True, sort the tones in rising order and remove
+                duplicates, using the tolerance of Tone.__eq__; default=False
         """
-        tones = []
-        for octave in range(-octaves_below, octaves_above + 1):
-            multiplier = 2**octave
-            tones.extend(
-                [Tone(multiplier * tone.freq) for tone in self.primaries]
+        with instrumentation.stage(
+            "Scale.extend", type(self).__name__
+        ) as measured:
+            octaves = np.arange(-octaves_below, octaves_above + 1)
+            num_primaries = len(self._frequencies)
+            freqs = np.outer(np.exp2(octaves), self._frequencies).ravel()
+            indices = np.tile(np.arange(num_primaries), len(octaves))
+            shifts = np.repeat(octaves, num_primaries)
+            if unique:
+                keep = self._sorted_unique_indices(freqs)
+                freqs = freqs[keep]
+                indices, shifts = indices[keep], shifts[keep]
+            measured.points = len(freqs)
+            return self._with_octave_shifts(freqs, indices, shifts)
+
+    def tones_between(self, lo_hz: float, hi_hz: float) -> "Scale":
+        """Return the Scale of every octave shift of the primaries in a range.
+
+        The primaries are treated as one octave-periodic pattern, i.e. every
+        primary tone is repeated in every octave, and the tones of that
+        pattern within [lo_hz, hi_hz] are returned in rising order without
+        duplicates. Unlike extend, there is no need to guess how many octaves
+        to add; e.g. scale.tones_between(20, 20000) covers the audible range.
+
+        Args:
+            lo_hz, hi_hz (float): the inclusive bounds of the range in Hz;
+                tones equal to a bound within Tone.DELTA_CENTS are included
+
+        Returns:
+            a Scale sharing the metadata of this Scale, with the tones in range
+        """
+        if lo_hz <= 0:
+            raise ValueError("lo_hz must be positive")
+        lo_hz, hi_hz = self._widen_range(lo_hz, hi_hz)
+        pattern, indices, shifts = self._octave_pattern()
+        if len(pattern) == 0 or hi_hz < lo_hz:
+            return self._with_octave_shifts(
+                pattern[:0], indices[:0], shifts[:0]
             )
-        new_scale = deepcopy(self)
-        new_scale.primaries = tuple(tones)
+        lowest = math.floor(math.log2(lo_hz / pattern[-1]))
+        highest = math.ceil(math.log2(hi_hz / pattern[0]))
+        octaves = np.arange(lowest, highest + 1)
+        freqs = np.outer(np.exp2(octaves), pattern).ravel()
+        in_range = (freqs > lo_hz) & (freqs < hi_hz)
+        indices = np.tile(indices, len(octaves))[in_range]
+        shifts = np.add.outer(octaves, shifts).ravel()[in_range]
+        return self._with_octave_shifts(freqs[in_range], indices, shifts)
+
+    def iter_tones_between(
+        self, lo_hz: float | None = None, hi_hz: float | None = None
+    ) -> Iterator[Tone]:
+        """Yield every octave shift of the primaries in a range, lazily.
+
+        Walks the same octave-periodic pattern as tones_between in rising
+        order, creating each Tone only when it is requested, so the consumer
+        may stop early, e.g. with itertools.islice or break.
+
+        Args:
+            lo_hz (float): the inclusive lower bound in Hz; default is the
+                lowest primary tone
+            hi_hz (float): the inclusive upper bound in Hz; default is no
+                bound, i.e. the generator never finishes on its own;
+                as in tones_between, tones equal to a bound within
+                Tone.DELTA_CENTS are included
+
+        Yields:
+            Tones in rising order
+        """
+        pattern = self._octave_pattern()[0].tolist()
+        if not pattern:
+            return
+        if lo_hz is None:
+            lo_hz = pattern[0]
+        if lo_hz <= 0:
+            raise ValueError("lo_hz must be positive")
+        lo_hz, hi_hz = self._widen_range(
+            lo_hz, math.inf if hi_hz is None else hi_hz
+        )
+        octave = math.floor(math.log2(lo_hz / pattern[-1]))
+        while True:
+            multiplier = 2.0**octave
+            for reduced in pattern:
+                freq = multiplier * reduced
+                if freq <= lo_hz:
+                    continue
+                if freq >= hi_hz:
+                    return
+                yield Tone(freq)
+            octave += 1
+
+    @staticmethod
+    def _widen_range(lo_hz: float, hi_hz: float) -> tuple[float, float]:
+        """Return the exclusive bounds of the tones equal to a closed range.
+
+        Each bound moves out by Tone.DELTA_CENTS, so a tone lies strictly
+        between the returned bounds when it is in [lo_hz, hi_hz] or equals
+        a bound as a Tone.
+        """
+        tolerance = 2.0 ** (Tone.DELTA_CENTS / 1200)
+        return lo_hz / tolerance, hi_hz * tolerance
+
+    def _octave_pattern(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return the primaries reduced into the octave above the lowest one.
+
+        Returns:
+            a 3-tuple of arrays: the sorted, unique frequencies f with
+            lowest <= f < 2*lowest, which repeated in every octave give all
+            the tones of the scale; and for each of those, the index of its
+            primary and the octaves it is shifted from that primary
+        """
+        freqs = self._frequencies
+        if len(freqs) == 0:
+            return freqs, np.arange(0), np.arange(0)
+        shifts = -np.floor(np.log2(freqs / freqs.min())).astype(np.int64)
+        reduced = freqs * np.exp2(shifts)
+        indices = self._sorted_unique_indices(reduced)
+        # the top of the octave may round to a duplicate of the bottom
+        if len(indices) > 1:
+            if Tone(reduced[indices[-1]]) == Tone(2 * reduced[indices[0]]):
+                indices = indices[:-1]
+        return reduced[indices], indices, shifts[indices]
+
+    def _with_octave_shifts(
+        self, freqs: np.ndarray, indices: np.ndarray, octaves: np.ndarray
+    ) -> "Scale":
+        """Return a shallow copy of this Scale with octave-shifted primaries.
+
+        Tone j of the copy is primary indices[j] of this Scale, shifted by
+        octaves[j] octaves, and has the frequency freqs[j]. Subclasses may
+        override this to carry along more than the frequencies.
+
+        The copy takes ownership of freqs, which must be a float64 array not
+        referenced elsewhere; it is made read-only here.
+        """
+        del indices, octaves  # only the frequencies are needed here
+        new_scale = copy(self)
+        freqs.flags.writeable = False
+        # bypass __setattr__, which would refuse if this Scale is frozen
+        vars(new_scale).update(_frequencies=freqs, _index=None)
         return new_scale
+
+    @staticmethod
+    def _sorted_unique_indices(freqs: np.ndarray) -> np.ndarray:
+        """Return the indices that sort the frequencies, minus near-duplicates.
+
+        A frequency is dropped when it is within the tolerance of Tone.__eq__
+        of its lower neighbor, so each run of near-equal tones is represented
+        by its lowest member.
+        """
+        order = np.argsort(freqs, kind="stable")
+        if len(order) < 2:
+            return order
+        sorted_freqs = freqs[order]
+        keep = np.empty(len(order), dtype=bool)
+        keep[0] = True
+        keep[1:] = (
+            1200 * np.log2(sorted_freqs[1:] / sorted_freqs[:-1])
+            >= Tone.DELTA_CENTS
+        )
+        return order[keep]
@@ -1,18 +1,116 @@
 """Tone: a single note."""
 
+import math
+from typing import Iterable
+
 
 class Tone:
     """A note having a distinct frequency.
 
+    The pitch is kept canonically in the log domain, as cents relative to
+    A440, so comparing two Tones is a subtraction in cents.
+
     Overrides comparators (e.g. equality, less than, greater than) with fuzzy
     comparison, scaled by DELTA_CENTS, to allow small floating point variation.
+
+    Tones are immutable and hashable. The hash is the tolerance bucket of the
+    pitch, i.e. cents quantized to DELTA_CENTS. Equal Tones always fall in the
+    same or neighboring buckets, so they share a hash except when they
+    straddle a bucket edge. Set and dict membership is therefore approximate:
+    a Tone may be missing from a set holding an equal Tone. To deduplicate or
+    intersect Tones within tolerance use Tone.unique and Tone.common, which
+    check the neighboring buckets too, and are exact.
     """
 
+    __slots__ = ("_freq", "_cents")
+
     DELTA_CENTS = 0.1  # allowable frequency difference in cents for equality
 
+    _A440 = 440.0  # reference wrt to int'l standard pitch, the zero in cents
+
     def __init__(self, freq: float) -> None:
-        self.freq = freq
-        self._delta = self.freq * self.DELTA_CENTS / 1200
+        self._freq = freq
+        self._cents = self.cents_from_freq(freq)
+
+    @property
+    def freq(self) -> float:
+        """The frequency in Hz."""
+        return self._freq
+
+    @property
+    def cents(self) -> float:
+        """The pitch in cents relative to A440, e.g. -900 for C4."""
+        return self._cents
+
+    @property
+    def bucket(self) -> int:
+        """The tolerance bucket of the pitch, used for hashing.
+
+        Tones that compare equal have buckets differing by at most 1. The
+        buckets are centered on whole multiples of DELTA_CENTS, so that
+        equal-tempered pitches, a whole number of cents from A440, lie far
+        from the bucket edges.
+        """
+        if not math.isfinite(self._cents):
+            return -1 if self._cents < 0 else 1  # out of the audible world
+        return math.floor(self._cents / self.DELTA_CENTS + 0.5)
+
+    @staticmethod
+    def cents_from_freq(freq: float) -> float:
+        """Convert a frequency in Hz to cents relative to A440.
+
+        A non-positive frequency, e.g. the placeholder Tone(0.0), is
+        infinitely far below A440.
+        """
+        if freq <= 0:
+            return -math.inf
+        return 1200 * math.log2(freq / Tone._A440)
+
+    @staticmethod
+    def unique(tones: Iterable["Tone"]) -> tuple["Tone", ...]:
+        """Return the tones with duplicates removed, keeping first occurrences.
+
+        Runs in linear time by hashing tones into tolerance buckets and
+        comparing only against the neighboring buckets.
+        """
+        buckets: dict[int, list[Tone]] = {}
+        unique = []
+        for tone in tones:
+            if Tone._in_buckets(tone, buckets):
+                continue
+            buckets.setdefault(tone.bucket, []).append(tone)
+            unique.append(tone)
+        return tuple(unique)
+
+    @staticmethod
+    def common(
+        tones_1: Iterable["Tone"], tones_2: Iterable["Tone"]
+    ) -> tuple["Tone", ...]:
+        """Return the tones of tones_1 that are equal to any of tones_2.
+
+        Runs in linear time; see Tone.unique.
+        """
+        buckets: dict[int, list[Tone]] = {}
+        for tone in tones_2:
+            buckets.setdefault(tone.bucket, []).append(tone)
+        return tuple(
+            tone for tone in tones_1 if Tone._in_buckets(tone, buckets)
+        )
+
+    @staticmethod
+    def _in_buckets(tone: "Tone", buckets: dict[int, list["Tone"]]) -> bool:
+        """True if a Tone equal to tone is held in the tolerance buckets.
+
+        Args:
+            tone (Tone): the Tone to look up
+            buckets (dict[int, list[Tone]]): Tones grouped by their bucket
+        """
+        bucket = tone.bucket
+        return any(
+            tone == other
+            for neighbor in (bucket - 1, bucket, bucket + 1)
+            for other in buckets.get(neighbor, ())
+        )
 
     def __str__(self) -> str:
         return f"{self.freq:.2f}"
@@ -20,39 +118,54 @@ class Tone:
     def __repr__(self) -> str:
         return str(self)
 
+    def __hash__(self) -> int:
+        """The hash of the tolerance bucket; see bucket.
+
+        Equal Tones straddling a bucket edge hash differently, so set and
+        dict lookups may miss them; use Tone.unique or Tone.common instead.
+        """
+        return hash(self.bucket)
+
     def __eq__(self, other: object) -> bool:
         """True if two Tones have the same frequency within delta cents."""
         if not isinstance(other, Tone):
             return NotImplemented
-        return abs(self.freq - other.freq) < self._delta
+        if self._cents == other._cents:
+            return True
+        return abs(self._cents - other._cents) < self.DELTA_CENTS
 
     def same_pitch_class(self, other: object) -> bool:
         """True if two Tones are any n octaves apart, i.e. same pitch class"""
         if not isinstance(other, Tone):
             return NotImplemented
-        freq1, freq2 = self.freq, other.freq
-        if self.freq > other.freq:
-            freq1, freq2 = other.freq, self.freq
-        while freq1 < freq2:
-            freq2 /= 2
-        return Tone(freq1) == Tone(freq2)
+        return self._is_whole_octaves(self._cents - other.cents)
+
+    @staticmethod
+    def _is_whole_octaves(cents: float) -> bool:
+        """True if an interval in cents is a whole number of octaves.
+
+        The interval is reduced modulo the octave, 1200 cents, and compared
+        with the tolerance DELTA_CENTS from both ends of the octave.
+        """
+        reduced = cents % 1200
+        return min(reduced, 1200 - reduced) < Tone.DELTA_CENTS
 
     def __lt__(self, other: object) -> bool:
         if not isinstance(other, Tone):
             return NotImplemented
-        return self.freq < other.freq - self._delta
+        return self._cents < other._cents - self.DELTA_CENTS
 
     def __le__(self, other: object) -> bool:
         if not isinstance(other, Tone):
             return NotImplemented
-        return self.freq <= other.freq - self._delta
+        return self._cents <= other._cents - self.DELTA_CENTS
 
     def __gt__(self, other: object) -> bool:
         if not isinstance(other, Tone):
             return NotImplemented
-        return self.freq > other.freq + self._delta
+        return self._cents > other._cents + self.DELTA_CENTS
 
     def __ge__(self, other: object) -> bool:
         if not isinstance(other, Tone):
             return NotImplemented
-        return self.freq >= other.freq + self._delta
+        return self._cents >= other._cents + self.DELTA_CENTS
@@ -2,13 +2,51 @@
 
 This module provides visualization tools for rendering musical scales as
 geometric plots. Users can import directly from this module:
-    from semitone.visuals import SpiralPlot, SpiralScale
+    from semitone.visuals import SpiralPlot, SpiralScale, SpiralExportSpec
+
+The exports are imported on first access, which loads plotly. pandas is only
+loaded by SpiralScale.get_dataframe_copy.
 """
 
-from .spiral_scale import SpiralScale
-from .spiral_plot import SpiralPlot
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .spiral_scale import SpiralScale
+    from .spiral_plot import SpiralPlot
+    from .spiral_export import SpiralExportSpec, SpiralExportResult
+    from .spiral_plot_cache import SpiralPlotCache
+    from .spiral_figure import SpiralFigure
 
 __all__ = [
     "SpiralScale",
     "SpiralPlot",
+    "SpiralExportSpec",
+    "SpiralExportResult",
+    "SpiralPlotCache",
+    "SpiralFigure",
 ]
+
+_LAZY_EXPORTS = {
+    "SpiralScale": ".spiral_scale",
+    "SpiralPlot": ".spiral_plot",
+    "SpiralExportSpec": ".spiral_export",
+    "SpiralExportResult": ".spiral_export",
+    "SpiralPlotCache": ".spiral_plot_cache",
+    "SpiralFigure": ".spiral_figure",
+}
+
+
+def __getattr__(name: str) -> Any:  # pylint: disable=invalid-name
+    """Import the visuals exports on first access."""
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(
+        importlib.import_module(_LAZY_EXPORTS[name], __name__), name
+    )
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:  # pylint: disable=invalid-name
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
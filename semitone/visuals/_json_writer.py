@@ -0,0 +1,100 @@
+"""SpiralJsonWriter"""
+
+import json
+from typing import Any, TextIO
+import numpy as np
+from ._spiral_plot_style import SpiralPlotStyle
+from ._spiral_trace_data import SpiralTraceData
+from ._spiral_figure_properties import SpiralFigureProperties
+
+
+class SpiralJsonWriter:
+    """Internal writer of spiral plot data straight to plotly figure JSON.
+
+    Writes JSON equal, once parsed, to that of the to_json method of the
+    figure built by SpiralPlot.draw, in the same compact form as plotly's
+    stdlib json engine: keys sorted, no whitespace, and "<", ">" and "/"
+    escaped so it can be embedded in HTML. The properties come from
+    SpiralFigureProperties, but no plotly objects are built, so none of
+    plotly's property validation is run.
+    """
+
+    CHUNK_SIZE = 2**16  # array elements encoded per write
+    _SEPARATORS = (",", ":")
+    _ESCAPES = (("<", "\\u003c"), (">", "\\u003e"), ("/", "\\u002f"))
+
+    @staticmethod
+    def write(
+        stream: TextIO,
+        traces: tuple[SpiralTraceData, ...],
+        tick_labels: tuple[str, ...],
+        style: SpiralPlotStyle,
+        trace_type: str = "scatterpolar",
+    ) -> None:
+        """Write the plotly figure JSON of a spiral plot to a text stream.
+
+        The document is written piece by piece, with coordinate arrays in
+        chunks of CHUNK_SIZE elements, so it is never held whole in memory.
+
+        Args:
+            stream (TextIO): where to write, e.g. an open text file or a
+                socket's makefile("w")
+            traces (tuple[SpiralTraceData, ...]): plot-ready data per scale
+            tick_labels (tuple[str, ...]): labels at the angular tick values
+            style (SpiralPlotStyle): visual style settings
+            trace_type (str): "scatterpolar" or "scatterpolargl"
+        """
+        stream.write('{"data":[')
+        for i, trace in enumerate(traces):
+            if i:
+                stream.write(",")
+            SpiralJsonWriter._write_object(
+                stream,
+                SpiralFigureProperties.trace(trace, i, style, trace_type),
+            )
+        stream.write('],"layout":')
+        layout = SpiralFigureProperties.layout(
+            SpiralTraceData.max_radius(traces), tick_labels, style
+        )
+        layout["template"] = {}  # the cleared template, as in draw
+        stream.write(SpiralJsonWriter._dumps(layout))
+        stream.write("}")
+
+    @staticmethod
+    def _write_object(stream: TextIO, properties: dict[str, Any]) -> None:
+        """Write a dict of properties, streaming its numpy array values."""
+        stream.write("{")
+        for i, name in enumerate(sorted(properties)):
+            if i:
+                stream.write(",")
+            stream.write(f"{SpiralJsonWriter._dumps(name)}:")
+            value = properties[name]
+            if isinstance(value, np.ndarray):
+                SpiralJsonWriter._write_array(stream, value)
+            else:
+                stream.write(SpiralJsonWriter._dumps(value))
+        stream.write("}")
+
+    @staticmethod
+    def _write_array(stream: TextIO, array: np.ndarray) -> None:
+        """Write a numeric array as a JSON list, a chunk at a time."""
+        stream.write("[")
+        for start in range(0, array.size, SpiralJsonWriter.CHUNK_SIZE):
+            if start:
+                stream.write(",")
+            chunk = array[start : start + SpiralJsonWriter.CHUNK_SIZE]
+            text = json.dumps(
+                chunk.tolist(), separators=SpiralJsonWriter._SEPARATORS
+            )
+            stream.write(text[1:-1])
+        stream.write("]")
+
+    @staticmethod
+    def _dumps(value: Any) -> str:
+        """Return compact JSON of a value, with keys sorted and HTML-safe."""
+        text = json.dumps(
+            value, sort_keys=True, separators=SpiralJsonWriter._SEPARATORS
+        )
+        for character, escaped in SpiralJsonWriter._ESCAPES:
+            text = text.replace(character, escaped)
+        return text
@@ -0,0 +1,132 @@
+"""SpiralFigureProperties"""
+
+from typing import Any
+from .. import EqualTempered
+from ._spiral_plot_style import SpiralPlotStyle
+from ._spiral_trace_data import SpiralTraceData
+
+
+class SpiralFigureProperties:
+    """Internal builders of the plotly properties of spiral plot figures.
+
+    Shared by every spiral plot figure, whether drawn at once, built up
+    scale by scale, or written as JSON, so that all of them look the same.
+    """
+
+    # plotly trace type of each render mode
+    TRACE_TYPES = {"svg": "scatterpolar", "webgl": "scatterpolargl"}
+
+    @staticmethod
+    def trace(
+        trace: SpiralTraceData,
+        index: int,
+        style: SpiralPlotStyle,
+        trace_type: str = "scatterpolar",
+    ) -> dict[str, Any]:
+        """Return the plotly properties of the polar scatter trace of a scale.
+
+        Args:
+            trace (SpiralTraceData): plot-ready data of the scale
+            index (int): position of the scale in the plot, which selects its
+                marker symbol and color
+            style (SpiralPlotStyle): visual style settings for trace markers
+            trace_type (str): "scatterpolar" or "scatterpolargl", which share
+                the same properties
+
+        Returns:
+            dict of plotly polar scatter trace properties
+        """
+        hovertemplate = (
+            f"<b>{trace.name}</b><br><br>name={trace.name}"
+            "<br>wavelength=%{r}<br>angle=%{theta}"
+        )
+        properties: dict[str, Any] = {
+            "type": trace_type,
+            "name": trace.name,
+            "legendgroup": trace.name,
+            "showlegend": True,
+            "subplot": "polar",
+            "mode": "markers",
+            "r": trace.radii,
+            "theta": trace.angles,
+            "marker": SpiralFigureProperties.marker(index, style),
+        }
+        if trace.counts is not None:
+            properties["customdata"] = trace.counts
+            hovertemplate += "<br>count=%{customdata}"
+        properties["hovertemplate"] = hovertemplate + "<extra></extra>"
+        return properties
+
+    @staticmethod
+    def marker(index: int, style: SpiralPlotStyle) -> dict[str, Any]:
+        """Return the plotly marker properties of the trace of a scale.
+
+        Args:
+            index (int): position of the scale in the plot, which selects its
+                marker symbol and color
+            style (SpiralPlotStyle): visual style settings for trace markers
+        """
+        return {
+            "color": style.marker_colors[index % len(style.marker_colors)],
+            "symbol": style.marker_symbols[index % len(style.marker_symbols)],
+            "size": style.marker_size,
+            "opacity": style.marker_opacity,
+            "line": {
+                "width": style.marker_line_width,
+                "color": style.marker_line_color,
+            },
+        }
+
+    @staticmethod
+    def angular_tick_labels(key: str) -> tuple[str, ...]:
+        """Return note labels used for angular axis ticks.
+
+        Args:
+            key (str): tonic used to construct equal-tempered note names
+
+        Returns:
+            tuple[str, ...]: note names (including enharmonics) for one octave
+        """
+        return EqualTempered(key).note_names_including_enharmonics()
+
+    @staticmethod
+    def layout(
+        max_radius: float,
+        tick_labels: tuple[str, ...],
+        style: SpiralPlotStyle,
+    ) -> dict[str, Any]:
+        """Return the plotly layout and axis properties of the figure.
+
+        Args:
+            max_radius (float): the outer bound of the radial axis
+            tick_labels (tuple[str, ...]): labels at the angular tick values
+            style (SpiralPlotStyle): layout and axis style settings
+
+        Returns:
+            dict of plotly layout properties
+        """
+        return {
+            "width": style.width,
+            "height": style.height,
+            "margin": {"t": 60},
+            "legend": {
+                "title": {"text": style.legend_title_text},
+                "tracegroupgap": 0,
+            },
+            "polar": {
+                "domain": {"x": [0.0, 1.0], "y": [0.0, 1.0]},
+                "radialaxis": {
+                    "range": [0, max_radius],
+                    "showticklabels": False,
+                    "showgrid": False,
+                    "showline": False,
+                    "ticks": "",
+                },
+                "angularaxis": {
+                    "direction": "clockwise",
+                    "rotation": 90,
+                    "tickvals": list(style.angular_tick_values),
+                    "ticktext": list(tick_labels),
+                },
+            },
+        }
@@ -12,6 +12,18 @@ class SpiralPlotStyle:
         "star",
         "triangle-down",
     )
+    marker_colors: tuple[str, ...] = (
+        "#1F77B4",
+        "#FF7F0E",
+        "#2CA02C",
+        "#D62728",
+        "#9467BD",
+        "#8C564B",
+        "#E377C2",
+        "#7F7F7F",
+        "#BCBD22",
+        "#17BECF",
+    )
     marker_size: int = 12
     marker_opacity: float = 0.5
     marker_line_width: int = 1
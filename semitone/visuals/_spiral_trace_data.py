@@ -0,0 +1,58 @@
+"""SpiralTraceData"""
+
+from dataclasses import dataclass
+import numpy as np
+from .. import Scale, Tone
+from .spiral_scale import SpiralScale
+
+
+@dataclass(frozen=True)
+class SpiralTraceData:
+    """Internal plot-ready polar coordinates of one scale in a SpiralPlot.
+
+    Attributes:
+        name (str): the name of the scale, shown in the legend
+        radii (numpy.ndarray): radial coordinates of the tones
+        angles (numpy.ndarray): angular coordinates of the tones, in degrees
+        counts (numpy.ndarray | None): after decimation, the number of tones
+            each point stands for; None if every tone is its own point
+    """
+
+    name: str
+    radii: np.ndarray
+    angles: np.ndarray
+    counts: np.ndarray | None = None
+
+    @staticmethod
+    def from_scale(
+        scale: Scale, zeroth_tone: Tone, octaves_below: int, octaves_above: int
+    ) -> "SpiralTraceData":
+        """Return the plot data of a Scale extended by some octaves.
+
+        The coordinates are the arrays of its SpiralScale, not copies.
+
+        Args:
+            scale (Scale): the scale to plot
+            zeroth_tone (Tone): the Tone placed at 12 o'clock, i.e. the
+                principle of the first scale of the plot
+            octaves_below, octaves_above (int): how many octaves to extend
+                outside the primary scale
+        """
+        extended_scale = scale.extend(octaves_below, octaves_above)
+        spiral_scale = SpiralScale(extended_scale, zeroth_tone)
+        return SpiralTraceData(
+            spiral_scale.name, spiral_scale.radii, spiral_scale.angles
+        )
+
+    @staticmethod
+    def max_radius(traces: "tuple[SpiralTraceData, ...]") -> float:
+        """Return the largest radius over all traces, or 0.0 if all empty."""
+        return max(
+            (float(trace.radii.max()) for trace in traces if trace.radii.size),
+            default=0.0,
+        )
+
+    @staticmethod
+    def total_points(traces: "tuple[SpiralTraceData, ...]") -> int:
+        """Return the number of points over all traces."""
+        return sum(trace.radii.size for trace in traces)
@@ -0,0 +1,199 @@
+"""SpiralSvgWriter"""
+
+import math
+from xml.sax.saxutils import escape, quoteattr
+import numpy as np
+from ._spiral_plot_style import SpiralPlotStyle
+from ._spiral_trace_data import SpiralTraceData
+
+
+class SpiralSvgWriter:
+    """Internal renderer of spiral plot data straight to an SVG document.
+
+    Lays out the figure like SpiralPlot.draw: the polar disk with its
+    clockwise angular axis starting at 12 o'clock, note-name ticks, and a
+    legend on the right, with markers styled by SpiralPlotStyle. It needs
+    only numpy and the standard library, so no browser is started.
+    """
+
+    MARGIN = 40  # pixels around the plot disk and legend
+    TICK_LABEL_SPACE = 24  # pixels between the disk and its tick labels
+    LEGEND_WIDTH = 140  # pixels reserved on the right for the legend
+    LEGEND_ROW_HEIGHT = 20  # pixels per legend entry
+    FONT = 'font-family="Open Sans, verdana, arial, sans-serif" font-size="12"'
+
+    @staticmethod
+    def render(
+        traces: tuple[SpiralTraceData, ...],
+        tick_labels: tuple[str, ...],
+        style: SpiralPlotStyle,
+    ) -> str:
+        """Return the SVG document of a spiral plot.
+
+        Args:
+            traces (tuple[SpiralTraceData, ...]): plot-ready data per scale
+            tick_labels (tuple[str, ...]): labels at the angular tick values
+            style (SpiralPlotStyle): visual style settings
+
+        Returns:
+            str holding a standalone SVG document
+        """
+        width, height = style.width, style.height
+        plot_width = width - SpiralSvgWriter.LEGEND_WIDTH
+        disk_radius = max(
+            min(plot_width, height) / 2
+            - SpiralSvgWriter.MARGIN
+            - SpiralSvgWriter.TICK_LABEL_SPACE,
+            1.0,
+        )
+        center_x, center_y = plot_width / 2, height / 2
+        max_radius = SpiralTraceData.max_radius(traces)
+        scale = disk_radius / max_radius if max_radius > 0 else 0.0
+
+        parts = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" '
+            f'xmlns:xlink="http://www.w3.org/1999/xlink" '
+            f'width="{width}" height="{height}" '
+            f'viewBox="0 0 {width} {height}">',
+            f'<rect width="{width}" height="{height}" fill="white"/>',
+            "<defs>",
+        ]
+        for i, symbol in enumerate(style.marker_symbols):
+            path = SpiralSvgWriter._symbol_path(symbol, style.marker_size / 2)
+            parts.append(f'<path id="marker-{i}" d="{path}"/>')
+        parts.append("</defs>")
+        parts.extend(
+            SpiralSvgWriter._axis_elements(
+                center_x, center_y, disk_radius, tick_labels, style
+            )
+        )
+        for i, trace in enumerate(traces):
+            angles = np.deg2rad(90.0 - trace.angles)
+            xs = center_x + scale * trace.radii * np.cos(angles)
+            ys = center_y - scale * trace.radii * np.sin(angles)
+            parts.append(SpiralSvgWriter._group_open(i, style))
+            parts.extend(
+                f'<use xlink:href="#marker-{i % len(style.marker_symbols)}" '
+                f'x="{x:.2f}" y="{y:.2f}"/>'
+                for x, y in zip(xs.tolist(), ys.tolist())
+            )
+            parts.append("</g>")
+        parts.extend(
+            SpiralSvgWriter._legend_elements(traces, plot_width, style)
+        )
+        parts.append("</svg>")
+        return "\n".join(parts)
+
+    @staticmethod
+    def _axis_elements(
+        center_x: float,
+        center_y: float,
+        disk_radius: float,
+        tick_labels: tuple[str, ...],
+        style: SpiralPlotStyle,
+    ) -> list[str]:
+        """Return the SVG elements of the disk, its spokes and tick labels."""
+        elements = [
+            f'<circle cx="{center_x:.2f}" cy="{center_y:.2f}" '
+            f'r="{disk_radius:.2f}" fill="none" stroke="#444"/>'
+        ]
+        label_radius = disk_radius + SpiralSvgWriter.TICK_LABEL_SPACE / 2
+        for value, label in zip(style.angular_tick_values, tick_labels):
+            angle = math.radians(90.0 - value)
+            cos, sin = math.cos(angle), math.sin(angle)
+            elements.append(
+                f'<line x1="{center_x:.2f}" y1="{center_y:.2f}" '
+                f'x2="{center_x + disk_radius * cos:.2f}" '
+                f'y2="{center_y - disk_radius * sin:.2f}" stroke="#eee"/>'
+            )
+            elements.append(
+                f'<text x="{center_x + label_radius * cos:.2f}" '
+                f'y="{center_y - label_radius * sin:.2f}" '
+                f'text-anchor="middle" dominant-baseline="central" '
+                f"{SpiralSvgWriter.FONT}>{escape(label)}</text>"
+            )
+        return elements
+
+    @staticmethod
+    def _legend_elements(
+        traces: tuple[SpiralTraceData, ...],
+        left: float,
+        style: SpiralPlotStyle,
+    ) -> list[str]:
+        """Return the SVG elements of the legend, titled and one row a trace."""
+        top = SpiralSvgWriter.MARGIN
+        row = SpiralSvgWriter.LEGEND_ROW_HEIGHT
+        elements = [
+            f'<text x="{left:.2f}" y="{top}" dominant-baseline="central" '
+            f"{SpiralSvgWriter.FONT}>{escape(style.legend_title_text)}</text>"
+        ]
+        for i, trace in enumerate(traces):
+            y = top + (i + 1) * row
+            elements.append(SpiralSvgWriter._group_open(i, style))
+            elements.append(
+                f'<use xlink:href="#marker-{i % len(style.marker_symbols)}" '
+                f'x="{left + row / 2:.2f}" y="{y}"/>'
+            )
+            elements.append("</g>")
+            elements.append(
+                f'<text x="{left + row * 1.5:.2f}" y="{y}" '
+                f'dominant-baseline="central" '
+                f"{SpiralSvgWriter.FONT}>{escape(trace.name)}</text>"
+            )
+        return elements
+
+    @staticmethod
+    def _group_open(index: int, style: SpiralPlotStyle) -> str:
+        """Return the opening tag of a group styled as the markers of a trace.
+
+        Args:
+            index (int): position of the trace, which selects its color
+            style (SpiralPlotStyle): visual style settings for trace markers
+        """
+        color = style.marker_colors[index % len(style.marker_colors)]
+        return (
+            f"<g fill={quoteattr(color)} "
+            f'fill-opacity="{style.marker_opacity}" '
+            f"stroke={quoteattr(style.marker_line_color)} "
+            f'stroke-width="{style.marker_line_width}" '
+            f'stroke-opacity="{style.marker_opacity}">'
+        )
+
+    @staticmethod
+    def _symbol_path(symbol: str, radius: float) -> str:
+        """Return the SVG path of a marker symbol centered on the origin.
+
+        Follows the plotly shapes of the same names; unknown symbols are
+        drawn as circles.
+
+        Args:
+            symbol (str): plotly marker symbol name, e.g. "triangle-down"
+            radius (float): half the marker size, in pixels
+        """
+        r = radius
+        if symbol == "square":
+            return f"M{r:.2f},{r:.2f}H-{r:.2f}V-{r:.2f}H{r:.2f}Z"
+        if symbol == "diamond":
+            d = r * 1.3
+            return f"M{d:.2f},0L0,{d:.2f}L-{d:.2f},0L0,-{d:.2f}Z"
+        if symbol in ("triangle-up", "triangle-down"):
+            half_base, half_height = r * 2 / math.sqrt(3), r / 2
+            sign = 1 if symbol == "triangle-down" else -1
+            return (
+                f"M-{half_base:.2f},{-sign * half_height:.2f}"
+                f"H{half_base:.2f}L0,{sign * r:.2f}Z"
+            )
+        if symbol == "star":
+            points = []
+            for k in range(10):
+                length = r * 1.3 if k % 2 == 0 else r * 0.5
+                angle = math.pi / 2 - k * math.pi / 5
+                points.append(
+                    f"{length * math.cos(angle):.2f},"
+                    f"{-length * math.sin(angle):.2f}"
+                )
+            return "M" + "L".join(points) + "Z"
+        return (
+            f"M{r:.2f},0A{r:.2f},{r:.2f} 0 1,1 0,-{r:.2f}"
+            f"A{r:.2f},{r:.2f} 0 0,1 {r:.2f},0Z"
+        )
@@ -0,0 +1,41 @@
+"""SpiralExportSpec and SpiralExportResult: batch image export records."""
+
+from dataclasses import dataclass
+from pathlib import Path
+from .. import Scale
+
+
+@dataclass(frozen=True)
+class SpiralExportSpec:
+    """One image to render with SpiralPlot.export_many.
+
+    Attributes:
+        filename (str): output file name, relative to the output directory;
+            its suffix (e.g. ".png", ".svg", ".pdf") sets the image format
+        scales (tuple[Scale, ...]): the scales to plot, as in SpiralPlot.draw
+        octaves_below, octaves_above (int): how many octaves to extend
+            outside each primary scale; defaults = don't extend
+        decimate (bool): if True, keep one point per scale per plot pixel
+    """
+
+    filename: str
+    scales: tuple[Scale, ...]
+    octaves_below: int = 0
+    octaves_above: int = 0
+    decimate: bool = False
+
+
+@dataclass(frozen=True)
+class SpiralExportResult:
+    """The outcome of exporting one SpiralExportSpec.
+
+    Attributes:
+        path (Path): the image file
+        seconds (float): time spent drawing and writing the image; 0.0 when
+            skipped
+        skipped (bool): True if the image was already up to date
+    """
+
+    path: Path
+    seconds: float
+    skipped: bool
@@ -0,0 +1,171 @@
+"""SpiralFigure"""
+
+from typing import Any
+import plotly.graph_objects as go
+from .. import Scale, Tone, instrumentation
+from ._spiral_plot_style import DEFAULT_SPIRAL_PLOT_STYLE
+from ._spiral_trace_data import SpiralTraceData
+from ._spiral_figure_properties import SpiralFigureProperties
+
+
+class SpiralFigure:
+    """A spiral plot that is changed one scale at a time.
+
+    Typical usage in a notebook:
+        >>> spiral = SpiralFigure(octaves_above=1)
+        >>> spiral.figure  # display the widget, then update it in place
+        >>> spiral.add_scale(st.Major("C"))
+        >>> spiral.add_scale(st.Minor("A"))
+        >>> spiral.restyle_scale("A mi", marker_color="black")
+        >>> spiral.remove_scale("C ma")
+
+    Each change touches only the trace of its scale, plus the radial range
+    when the outermost point changes, so its cost does not grow with the
+    number of scales shown. The figure is a plotly FigureWidget, which
+    updates in place in notebooks and dashboards, or a plain Figure when
+    ipywidgets is not installed.
+
+    The first scale added sets the key, i.e. the angular ticks and the tone
+    at 12 o'clock, for the life of the figure, as the first scale does in
+    SpiralPlot.draw. Each scale keeps the marker style of the position at
+    which it was added, even when earlier scales are removed.
+    """
+
+    def __init__(
+        self,
+        octaves_below: int = 0,
+        octaves_above: int = 0,
+        render_mode: str = "svg",
+    ) -> None:
+        """Initialize an empty figure.
+
+        Args:
+            octaves_below, octaves_above (int): how many octaves to extend
+                outside each primary scale added; defaults = don't extend
+            render_mode (str): "svg" for Scatterpolar traces or "webgl" for
+                Scatterpolargl traces; see SpiralPlot.draw
+
+        Raises:
+            ValueError: if render_mode is not one of the above
+        """
+        if render_mode not in SpiralFigureProperties.TRACE_TYPES:
+            raise ValueError(
+                f"unknown render_mode {render_mode!r}; "
+                "expected 'svg' or 'webgl'"
+            )
+        self.octaves_below = octaves_below
+        self.octaves_above = octaves_above
+        self._trace_type = SpiralFigureProperties.TRACE_TYPES[render_mode]
+        self._style = DEFAULT_SPIRAL_PLOT_STYLE
+        self._figure = self._new_figure()
+        self._zeroth_tone: Tone | None = None
+        self._traces: dict[str, Any] = {}  # scale name to plotly trace
+        self._max_radii: dict[str, float] = {}  # scale name to its max radius
+        self._max_radius = 0.0
+        self._num_added = 0
+
+    @property
+    def figure(self) -> go.FigureWidget | go.Figure:
+        """The plotly figure, updated in place by every change."""
+        return self._figure
+
+    @property
+    def scale_names(self) -> tuple[str, ...]:
+        """The names of the scales shown, in the order they were added."""
+        return tuple(self._traces)
+
+    def add_scale(self, scale: Scale) -> None:
+        """Show one more scale, as one new trace.
+
+        Args:
+            scale (Scale): the scale to add; its scale_name identifies it
+
+        Raises:
+            ValueError: if a scale of the same name is already shown
+        """
+        name = scale.scale_name
+        if name in self._traces:
+            raise ValueError(f"a scale named {name!r} is already shown")
+        with instrumentation.stage("SpiralFigure.add_scale") as measured:
+            with self._figure.batch_update():
+                if self._zeroth_tone is None:
+                    self._zeroth_tone = scale.principle
+                    self._figure.update_layout(
+                        SpiralFigureProperties.layout(
+                            0.0,
+                            SpiralFigureProperties.angular_tick_labels(
+                                scale.key_name
+                            ),
+                            self._style,
+                        )
+                    )
+                trace = SpiralTraceData.from_scale(
+                    scale,
+                    self._zeroth_tone,
+                    self.octaves_below,
+                    self.octaves_above,
+                )
+                self._figure.add_trace(
+                    SpiralFigureProperties.trace(
+                        trace, self._num_added, self._style, self._trace_type
+                    )
+                )
+                self._num_added += 1
+                self._traces[name] = self._figure.data[-1]
+                self._max_radii[name] = SpiralTraceData.max_radius((trace,))
+                if self._max_radii[name] > self._max_radius:
+                    self._set_max_radius(self._max_radii[name])
+            measured.points = trace.radii.size
+
+    def remove_scale(self, name: str) -> None:
+        """Stop showing a scale, deleting only its trace.
+
+        Args:
+            name (str): the scale_name of the scale to remove
+
+        Raises:
+            KeyError: if no scale of that name is shown
+        """
+        if name not in self._traces:
+            raise KeyError(f"no scale named {name!r} is shown")
+        with instrumentation.stage("SpiralFigure.remove_scale"):
+            removed = self._traces.pop(name)
+            with self._figure.batch_update():
+                self._figure.data = tuple(
+                    trace for trace in self._figure.data if trace is not removed
+                )
+                if self._max_radii.pop(name) >= self._max_radius:
+                    self._set_max_radius(
+                        max(self._max_radii.values(), default=0.0)
+                    )
+
+    def restyle_scale(self, name: str, **properties: Any) -> None:
+        """Change the plotly properties of the trace of one scale.
+
+        Args:
+            name (str): the scale_name of the scale to restyle
+            properties: plotly trace properties, in the form accepted by
+                update, e.g. marker_color="black" or visible="legendonly"
+
+        Raises:
+            KeyError: if no scale of that name is shown
+        """
+        if name not in self._traces:
+            raise KeyError(f"no scale named {name!r} is shown")
+        with instrumentation.stage("SpiralFigure.restyle_scale"):
+            self._traces[name].update(**properties)
+
+    def _set_max_radius(self, max_radius: float) -> None:
+        """Set the outer bound of the radial axis."""
+        self._max_radius = max_radius
+        self._figure.layout.polar.radialaxis.range = [0, max_radius]
+
+    @staticmethod
+    def _new_figure() -> go.FigureWidget | go.Figure:
+        """Return an empty FigureWidget, or Figure without ipywidgets."""
+        try:
+            figure = go.FigureWidget()
+        except ImportError:
+            figure = go.Figure()
+        figure.update_layout(template=None)  # as in SpiralPlot.draw
+        return figure
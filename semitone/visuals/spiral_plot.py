@@ -1,21 +1,38 @@
 """SpiralPlot"""
 
-import plotly.express as px
+import concurrent.futures
+import hashlib
+import io
+import multiprocessing
+import os
+import time
+from pathlib import Path
+from typing import Iterable, TextIO
+import numpy as np
 import plotly.graph_objects as go
-import pandas as pd
-from .. import Scale, EqualTempered
-from . import SpiralScale
+import plotly.io as pio
+from .. import Scale, instrumentation
 from ._spiral_plot_style import SpiralPlotStyle, DEFAULT_SPIRAL_PLOT_STYLE
+from ._spiral_trace_data import SpiralTraceData
+from ._spiral_figure_properties import SpiralFigureProperties
+from ._svg_writer import SpiralSvgWriter
+from ._json_writer import SpiralJsonWriter
+from .spiral_export import SpiralExportSpec, SpiralExportResult
 
 
 class SpiralPlot:
     """The graphical depiction of one or more scales as logarithmic spirals."""
 
+    # total number of points above which render_mode="auto" switches to WebGL
+    WEBGL_POINT_THRESHOLD = 10_000
+
     @staticmethod
     def draw(
         scales: tuple[Scale, ...],
         octaves_below: int = 0,
         octaves_above: int = 0,
+        render_mode: str = "auto",
+        decimate: bool = False,
     ) -> go.Figure:
         """Render one or more scales as a spiral polar plot.
 
@@ -24,123 +41,450 @@ class SpiralPlot:
                 with the primary of the first Scale setting the overall key
             octaves_below, octaves_above (int): how many octaves to extend
                 outside each primary scale; defaults = don't extend
+            render_mode (str): "svg" for Scatterpolar traces, "webgl" for
+                Scatterpolargl traces, which stay interactive with very many
+                points, or "auto" to use WebGL only when the plot has more
+                than WEBGL_POINT_THRESHOLD points
+            decimate (bool): if True, keep only one point per scale in each
+                pixel of the plot, with the number of tones it stands for
+                shown on hover; useful for spirals extended over many octaves,
+                whose inner turns collapse onto a few pixels
         Returns:
             a plotly graph_objects.Figure
         """
-        combined_df = SpiralPlot._generate_data_for_all_scales(
-            scales, octaves_below, octaves_above
-        )
-        key = scales[0].key_name
+        with instrumentation.stage("SpiralPlot.draw") as measured:
+            traces = SpiralPlot._prepare_traces(
+                scales, octaves_below, octaves_above, decimate
+            )
+            key = scales[0].key_name
+            trace_type = SpiralPlot._trace_type(render_mode, traces)
+            with instrumentation.stage(
+                "SpiralPlot.build_figure", trace_type
+            ) as building:
+                fig = SpiralPlot._build_figure(
+                    traces, key, DEFAULT_SPIRAL_PLOT_STYLE, trace_type
+                )
+                building.points = SpiralTraceData.total_points(traces)
+            measured.points = building.points
+        return fig
+
+    @staticmethod
+    def draw_svg(
+        scales: tuple[Scale, ...],
+        octaves_below: int = 0,
+        octaves_above: int = 0,
+        decimate: bool = False,
+    ) -> str:
+        """Render one or more scales as a spiral plot in an SVG document.
+
+        Writes the SVG text directly from the polar coordinates, laid out
+        and styled like draw, without plotly or an image export engine; fast
+        enough for batches of static thumbnails. There is no hover text.
+
+        Args:
+            scales (list[Scale]): one or more scales to plot,
+                with the primary of the first Scale setting the overall key
+            octaves_below, octaves_above (int): how many octaves to extend
+                outside each primary scale; defaults = don't extend
+            decimate (bool): if True, keep only one point per scale in each
+                pixel of the plot; see draw
+        Returns:
+            str holding a standalone SVG document
+        """
+        with instrumentation.stage("SpiralPlot.draw_svg") as measured:
+            traces = SpiralPlot._prepare_traces(
+                scales, octaves_below, octaves_above, decimate
+            )
+            key = scales[0].key_name
+            with instrumentation.stage("SpiralPlot.render_svg") as rendering:
+                tick_labels = SpiralFigureProperties.angular_tick_labels(key)
+                svg = SpiralSvgWriter.render(
+                    traces, tick_labels, DEFAULT_SPIRAL_PLOT_STYLE
+                )
+                rendering.points = SpiralTraceData.total_points(traces)
+            measured.points = rendering.points
+        return svg
+
+    @staticmethod
+    def write_json(
+        stream: TextIO,
+        scales: tuple[Scale, ...],
+        octaves_below: int = 0,
+        octaves_above: int = 0,
+        render_mode: str = "auto",
+        decimate: bool = False,
+    ) -> None:
+        """Write one or more scales as the plotly JSON of a spiral plot.
+
+        Writes JSON equal, once parsed, to draw(...).to_json(), for plotly.js
+        to render, straight from the polar coordinates without building the
+        Figure, so none of plotly's per-property validation is run. The text
+        may differ, e.g. in key order or, with plotly's orjson engine, in
+        the formatting of small floats. The document is
+        written in pieces, never held whole in memory, so it can stream to a
+        file or a socket.
 
-        fig = SpiralPlot._build_base_figure(combined_df)
-        SpiralPlot._apply_trace_style(fig, DEFAULT_SPIRAL_PLOT_STYLE)
-        SpiralPlot._apply_layout_style(
-            fig, combined_df, key, DEFAULT_SPIRAL_PLOT_STYLE
+        Args:
+            stream (TextIO): where to write, e.g. an open text file or a
+                socket's makefile("w")
+            scales (list[Scale]): one or more scales to plot,
+                with the primary of the first Scale setting the overall key
+            octaves_below, octaves_above (int): how many octaves to extend
+                outside each primary scale; defaults = don't extend
+            render_mode (str): "svg", "webgl" or "auto"; see draw
+            decimate (bool): if True, keep only one point per scale in each
+                pixel of the plot; see draw
+
+        Raises:
+            ValueError: if render_mode is not one of the above
+        """
+        with instrumentation.stage("SpiralPlot.write_json") as measured:
+            traces = SpiralPlot._prepare_traces(
+                scales, octaves_below, octaves_above, decimate
+            )
+            key = scales[0].key_name
+            trace_type = SpiralPlot._trace_type(render_mode, traces)
+            with instrumentation.stage(
+                "SpiralPlot.render_json", trace_type
+            ) as rendering:
+                SpiralJsonWriter.write(
+                    stream,
+                    traces,
+                    SpiralFigureProperties.angular_tick_labels(key),
+                    DEFAULT_SPIRAL_PLOT_STYLE,
+                    trace_type,
+                )
+                rendering.points = SpiralTraceData.total_points(traces)
+            measured.points = rendering.points
+
+    @staticmethod
+    def draw_json(
+        scales: tuple[Scale, ...],
+        octaves_below: int = 0,
+        octaves_above: int = 0,
+        render_mode: str = "auto",
+        decimate: bool = False,
+    ) -> str:
+        """Return the plotly JSON of a spiral plot, as written by write_json.
+
+        Args:
+            the same as draw
+
+        Returns:
+            str holding the plotly figure JSON, equal once parsed to
+            draw(...).to_json()
+        """
+        stream = io.StringIO()
+        SpiralPlot.write_json(
+            stream, scales, octaves_below, octaves_above, render_mode, decimate
         )
-        return fig
+        return stream.getvalue()
 
     @staticmethod
-    def _build_base_figure(combined_df: pd.DataFrame) -> go.Figure:
-        """Create the base polar scatter figure from prepared plot data.
+    def _prepare_traces(
+        scales: tuple[Scale, ...],
+        octaves_below: int,
+        octaves_above: int,
+        decimate: bool,
+    ) -> tuple[SpiralTraceData, ...]:
+        """Return the plot data of the scales, decimated if requested.
+
+        Runs the "SpiralPlot.generate_data" and "SpiralPlot.decimate"
+        instrumentation stages; see semitone.instrumentation.
+        """
+        with instrumentation.stage("SpiralPlot.generate_data") as measured:
+            traces = SpiralPlot._generate_data_for_all_scales(
+                scales, octaves_below, octaves_above
+            )
+            measured.points = SpiralTraceData.total_points(traces)
+        if decimate:
+            with instrumentation.stage("SpiralPlot.decimate") as measured:
+                traces = SpiralPlot._decimate(traces, DEFAULT_SPIRAL_PLOT_STYLE)
+                measured.points = SpiralTraceData.total_points(traces)
+        return traces
+
+    @staticmethod
+    def export_many(
+        specs: Iterable[SpiralExportSpec],
+        out_dir: str | Path,
+        workers: int | None = None,
+    ) -> list[SpiralExportResult]:
+        """Draw and write many spiral plot images in parallel.
+
+        The images are spread over a pool of worker processes, each keeping
+        one export engine (kaleido) running for all its images. Next to each
+        image a hidden sidecar file records a digest of its spec and of the
+        plot style; an image whose digest is unchanged is skipped.
+
+        Workers are started fresh ("spawn"), so a script calling this must
+        guard its entry point with if __name__ == "__main__".
 
         Args:
-            combined_df (pandas.DataFrame): plot-ready scale data with polar
-                columns used by plotly.express.scatter_polar
+            specs (Iterable[SpiralExportSpec]): the images to export
+            out_dir (str | Path): the directory to write into, created if
+                missing
+            workers (int | None): number of worker processes; default is the
+                number of CPUs
 
         Returns:
-            a plotly graph_objects.Figure with one trace per scale
+            list of SpiralExportResult, one per spec, in the order of specs
         """
-        return px.scatter_polar(
-            combined_df,
-            r="wavelength",
-            theta="angle",
-            color="name",
-            template="simple_white",
-            hover_name="name",
+        out_dir = Path(out_dir)
+        out_dir.mkdir(parents=True, exist_ok=True)
+        specs = list(specs)
+        paths = [out_dir / spec.filename for spec in specs]
+        digests = [SpiralPlot._export_digest(spec) for spec in specs]
+        results = [
+            SpiralExportResult(path, 0.0, skipped=True) for path in paths
+        ]
+        pending = [
+            i
+            for i, (path, digest) in enumerate(zip(paths, digests))
+            if not SpiralPlot._is_exported(path, digest)
+        ]
+        if pending:
+            workers = min(workers or os.cpu_count() or 1, len(pending))
+            with concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=SpiralPlot._start_export_worker,
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        SpiralPlot._export_one, specs[i], paths[i], digests[i]
+                    ): i
+                    for i in pending
+                }
+                for future in concurrent.futures.as_completed(futures):
+                    results[futures[future]] = future.result()
+        return results
+
+    @staticmethod
+    def _start_export_worker() -> None:
+        """Start the export engine of a worker process with a blank image."""
+        pio.to_image(go.Figure(), format="png", width=10, height=10)
+
+    @staticmethod
+    def _export_one(
+        spec: SpiralExportSpec, path: Path, digest: str
+    ) -> SpiralExportResult:
+        """Draw and write one image and its sidecar digest, timing both."""
+        start = time.perf_counter()
+        fig = SpiralPlot.draw(
+            spec.scales,
+            spec.octaves_below,
+            spec.octaves_above,
+            render_mode="svg",
+            decimate=spec.decimate,
+        )
+        fig.write_image(path)
+        SpiralPlot._export_sidecar(path).write_text(digest)
+        return SpiralExportResult(path, time.perf_counter() - start, False)
+
+    @staticmethod
+    def _is_exported(path: Path, digest: str) -> bool:
+        """True if an image exists and its sidecar holds the given digest."""
+        sidecar = SpiralPlot._export_sidecar(path)
+        return (
+            path.is_file()
+            and sidecar.is_file()
+            and sidecar.read_text() == digest
         )
 
     @staticmethod
-    def _apply_trace_style(fig: go.Figure, style: SpiralPlotStyle) -> None:
-        """Apply marker-level style settings to each series trace.
+    def _export_sidecar(path: Path) -> Path:
+        """Return the hidden file holding the spec digest of an image."""
+        return path.with_name(f".{path.name}.digest")
+
+    @staticmethod
+    def _export_digest(spec: SpiralExportSpec) -> str:
+        """Return a digest of everything that determines an exported image.
+
+        This is the content key of the drawing plus the output format.
+        """
+        key = SpiralPlot.content_key(
+            spec.scales,
+            spec.octaves_below,
+            spec.octaves_above,
+            render_mode="svg",
+            decimate=spec.decimate,
+        )
+        return f"{key}{Path(spec.filename).suffix}"
+
+    @staticmethod
+    def content_key(
+        scales: tuple[Scale, ...],
+        octaves_below: int = 0,
+        octaves_above: int = 0,
+        render_mode: str = "auto",
+        decimate: bool = False,
+    ) -> str:
+        """Return a stable digest of the inputs that determine a drawing.
+
+        Covers the key, name and principle of each scale, its frequencies
+        within tolerance (see Scale.buckets), the arguments of draw, and the
+        plot style, so equal keys give equal figures (up to the tolerance),
+        across processes and runs.
 
         Args:
-            fig (plotly.graph_objects.Figure): figure whose traces should be
-                updated
-            style (SpiralPlotStyle): visual style settings for trace markers
+            the same as draw
+
+        Returns:
+            str holding a hex SHA-256 digest
         """
-        for i, trace in enumerate(fig.data):
-            trace.update(
-                marker_symbol=style.marker_symbols[
-                    i % len(style.marker_symbols)
-                ],
-                marker_size=style.marker_size,
-                marker_opacity=style.marker_opacity,
-                marker_line_width=style.marker_line_width,
-                marker_line_color=style.marker_line_color,
+        digest = hashlib.sha256()
+        digest.update(
+            repr(
+                (
+                    octaves_below,
+                    octaves_above,
+                    render_mode,
+                    decimate,
+                    DEFAULT_SPIRAL_PLOT_STYLE,
+                )
+            ).encode()
+        )
+        for scale in scales:
+            digest.update(
+                repr(
+                    (
+                        scale.key_name,
+                        scale.scale_name,
+                        scale.principle.bucket,
+                        len(scale.frequencies),
+                    )
+                ).encode()
             )
+            digest.update(scale.buckets().tobytes())
+        return digest.hexdigest()
 
     @staticmethod
-    def _build_angular_tick_labels(key: str) -> tuple[str, ...]:
-        """Return note labels used for angular axis ticks.
+    def _trace_type(
+        render_mode: str, traces: tuple[SpiralTraceData, ...]
+    ) -> str:
+        """Return the plotly trace type used for a render mode.
 
         Args:
-            key (str): tonic used to construct equal-tempered note names
+            render_mode (str): "svg", "webgl" or "auto"
+            traces (tuple[SpiralTraceData, ...]): plot-ready data per scale,
+                whose total size decides the "auto" mode
 
-        Returns:
-            tuple[str, ...]: note names (including enharmonics) for one octave
+        Raises:
+            ValueError: if render_mode is not one of the above
         """
-        return EqualTempered(key).note_names_including_enharmonics()
+        if render_mode == "auto":
+            num_points = SpiralTraceData.total_points(traces)
+            if num_points > SpiralPlot.WEBGL_POINT_THRESHOLD:
+                render_mode = "webgl"
+            else:
+                render_mode = "svg"
+        try:
+            return SpiralFigureProperties.TRACE_TYPES[render_mode]
+        except KeyError:
+            raise ValueError(
+                f"unknown render_mode {render_mode!r}; "
+                "expected 'auto', 'svg' or 'webgl'"
+            ) from None
 
     @staticmethod
-    def _apply_layout_style(
-        fig: go.Figure,
-        combined_df: pd.DataFrame,
+    def _build_figure(
+        traces: tuple[SpiralTraceData, ...],
         key: str,
         style: SpiralPlotStyle,
-    ) -> None:
-        """Apply layout and axis styling to the figure.
+        trace_type: str = "scatterpolar",
+    ) -> go.Figure:
+        """Create the styled polar scatter figure from prepared plot data.
+
+        Each trace is built directly from its coordinate arrays with its
+        style already set, so no per-trace updates are needed afterwards.
 
         Args:
-            fig (plotly.graph_objects.Figure): figure to configure
-            combined_df (pandas.DataFrame): plotted data used to infer radial
-                axis bounds
+            traces (tuple[SpiralTraceData, ...]): plot-ready data per scale
             key (str): tonic used to derive angular tick labels
-            style (SpiralPlotStyle): layout and axis style settings
+            style (SpiralPlotStyle): visual style settings
+            trace_type (str): "scatterpolar" or "scatterpolargl"
+
+        Returns:
+            a plotly graph_objects.Figure with one trace per scale
         """
-        max_wavelength = combined_df["wavelength"].max()
-        angular_tick_labels = SpiralPlot._build_angular_tick_labels(key)
-
-        fig.update_layout(
-            width=style.width,
-            height=style.height,
-            template=None,
-            legend_title_text=style.legend_title_text,
-            polar=dict(
-                radialaxis=dict(
-                    range=[0, max_wavelength],
-                    showticklabels=False,
-                    showgrid=False,
-                    showline=False,
-                    ticks="",
-                ),
-                angularaxis=dict(
-                    tickvals=style.angular_tick_values,
-                    ticktext=angular_tick_labels,
-                ),
+        fig = go.Figure(
+            data=[
+                SpiralFigureProperties.trace(trace, i, style, trace_type)
+                for i, trace in enumerate(traces)
+            ],
+            layout=SpiralFigureProperties.layout(
+                SpiralTraceData.max_radius(traces),
+                SpiralFigureProperties.angular_tick_labels(key),
+                style,
             ),
         )
+        # serialized as "template": {}, so reloading skips the default one
+        fig.update_layout(template=None)
+        return fig
+
+    @staticmethod
+    def _decimate(
+        traces: tuple[SpiralTraceData, ...], style: SpiralPlotStyle
+    ) -> tuple[SpiralTraceData, ...]:
+        """Return the traces keeping one point per scale per plot pixel.
+
+        The plot disk is binned into a square grid of min(width, height)
+        cells across, a little finer than the pixels actually drawn, since
+        margins and the legend shrink the disk. In each occupied cell the
+        point of largest radius represents the scale, so the radial extent
+        of the plot is unchanged, and counts records how many tones it
+        stands for. Points keep their original order.
+
+        Args:
+            traces (tuple[SpiralTraceData, ...]): plot-ready data per scale
+            style (SpiralPlotStyle): visual style settings giving plot size
+
+        Returns:
+            tuple of decimated SpiralTraceData, one per scale
+        """
+        max_radius = SpiralTraceData.max_radius(traces)
+        if max_radius <= 0:
+            return traces
+        num_cells = min(style.width, style.height)
+        half = num_cells // 2
+        decimated = []
+        for trace in traces:
+            thetas = np.deg2rad(trace.angles)
+            scaled = trace.radii * (half / max_radius)
+            rows = np.floor(scaled * np.sin(thetas)).astype(np.int64) + half
+            cols = np.floor(scaled * np.cos(thetas)).astype(np.int64) + half
+            cells = np.clip(rows, 0, num_cells - 1) * num_cells + np.clip(
+                cols, 0, num_cells - 1
+            )
+            by_radius = np.argsort(-trace.radii, kind="stable")
+            _, first, counts = np.unique(
+                cells[by_radius], return_index=True, return_counts=True
+            )
+            keep = by_radius[first]
+            order = np.argsort(keep)
+            keep = keep[order]
+            decimated.append(
+                SpiralTraceData(
+                    trace.name,
+                    trace.radii[keep],
+                    trace.angles[keep],
+                    counts[order],
+                )
+            )
+        return tuple(decimated)
 
     @staticmethod
     def _generate_data_for_all_scales(
         scales: tuple[Scale, ...],
         octaves_below: int,
         octaves_above: int,
-    ) -> pd.DataFrame:
-        """Return combined polar plot data for one or more extended scales.
+    ) -> tuple[SpiralTraceData, ...]:
+        """Return polar plot data for one or more extended scales.
 
         Each input Scale is first expanded by the requested number of octaves,
-        converted to polar coordinates, and then concatenated into a single
-        dataframe suitable for plotting.
+        and its frequencies are then converted to polar coordinates in one
+        vectorized pass; the SpiralScale arrays become the trace arrays
+        without copying.
 
         Args:
             scales (list[Scale]): the set of scales to convert
@@ -148,14 +492,12 @@ class SpiralPlot:
                 outside each primary scale; defaults = don't extend
 
         Returns:
-            pandas.DataFrame; see SpiralScale.get_dataframe_copy() for details
+            tuple of SpiralTraceData, one per scale
         """
         overall_key = scales[0].principle
-        frames = []
-        for scale in scales:
-            extended_scale = scale.extend(octaves_below, octaves_above)
-            spiral_scale = SpiralScale(extended_scale, overall_key)
-            df = spiral_scale.get_dataframe_copy()
-            frames.append(df)
-
-        return pd.concat(frames, ignore_index=True)
+        return tuple(
+            SpiralTraceData.from_scale(
+                scale, overall_key, octaves_below, octaves_above
+            )
+            for scale in scales
+        )
@@ -0,0 +1,215 @@
+"""SpiralPlotCache"""
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import NamedTuple
+import plotly.graph_objects as go
+import plotly.io as pio
+from .. import Scale
+from .spiral_plot import SpiralPlot
+
+
+class SpiralPlotCacheInfo(NamedTuple):
+    """Statistics of a SpiralPlotCache."""
+
+    figure_hits: int
+    figure_misses: int
+    figures: int  # number of figures held in memory
+    image_hits: int
+    image_misses: int
+    image_bytes: int  # total size of the images held on disk
+
+
+@dataclass
+class _CacheEntry:
+    """The forms of one drawing held in the cache, each made on demand."""
+
+    figure: go.Figure | None = None
+    figure_json: str | None = None
+
+
+class SpiralPlotCache:
+    """A content-addressed cache of drawn and rendered spiral plots.
+
+    Entries are keyed by SpiralPlot.content_key, a digest of the scale
+    frequencies within tolerance, their names, the draw arguments and the
+    plot style, so an identical request is served without redrawing even
+    when it is made with new but equal Scale objects.
+
+    Drawings are held in memory, as Figures for draw and as plotly JSON for
+    draw_json, evicting the least recently used beyond max_figures. A hit
+    returns the held object itself, without rebuilding or validating
+    anything. Rendered images are held on disk, in image_dir, evicting the
+    least recently used beyond max_image_bytes.
+    """
+
+    def __init__(
+        self,
+        max_figures: int = 256,
+        image_dir: str | Path | None = None,
+        max_image_bytes: int = 256 * 2**20,
+    ) -> None:
+        """Initialize.
+
+        Args:
+            max_figures (int): the number of figures kept in memory
+            image_dir (str | Path | None): a directory used only for the
+                image store, created if missing; default None keeps no images
+            max_image_bytes (int): the total size of the image store
+        """
+        self.max_figures = max_figures
+        self.image_dir = None if image_dir is None else Path(image_dir)
+        self.max_image_bytes = max_image_bytes
+        self._figures: OrderedDict[str, _CacheEntry] = OrderedDict()
+        self._figure_hits = self._figure_misses = 0
+        self._image_hits = self._image_misses = 0
+        if self.image_dir is not None:
+            self.image_dir.mkdir(parents=True, exist_ok=True)
+
+    def draw(
+        self,
+        scales: tuple[Scale, ...],
+        octaves_below: int = 0,
+        octaves_above: int = 0,
+        render_mode: str = "auto",
+        decimate: bool = False,
+    ) -> go.Figure:
+        """Return SpiralPlot.draw of the arguments, drawing only on a miss.
+
+        The Figure is shared by every call with equal arguments, so treat it
+        as read-only; copy it with go.Figure(fig) before modifying it.
+        Copying costs about as much as drawing, which is why a hit does not.
+
+        Args:
+            the same as SpiralPlot.draw
+        """
+        key = SpiralPlot.content_key(
+            scales, octaves_below, octaves_above, render_mode, decimate
+        )
+        entry = self._entry(key)
+        if entry.figure is None:
+            self._figure_misses += 1
+            entry.figure = SpiralPlot.draw(
+                scales, octaves_below, octaves_above, render_mode, decimate
+            )
+        else:
+            self._figure_hits += 1
+        return entry.figure
+
+    def draw_json(
+        self,
+        scales: tuple[Scale, ...],
+        octaves_below: int = 0,
+        octaves_above: int = 0,
+        render_mode: str = "auto",
+        decimate: bool = False,
+    ) -> str:
+        """Return SpiralPlot.draw_json of the arguments, drawing only on a miss.
+
+        For callers that forward the figure to plotly.js, e.g. a web service;
+        a hit costs only the content key.
+
+        Args:
+            the same as SpiralPlot.draw
+        """
+        key = SpiralPlot.content_key(
+            scales, octaves_below, octaves_above, render_mode, decimate
+        )
+        entry = self._entry(key)
+        if entry.figure_json is None:
+            self._figure_misses += 1
+            entry.figure_json = SpiralPlot.draw_json(
+                scales, octaves_below, octaves_above, render_mode, decimate
+            )
+        else:
+            self._figure_hits += 1
+        return entry.figure_json
+
+    def to_image(
+        self,
+        scales: tuple[Scale, ...],
+        octaves_below: int = 0,
+        octaves_above: int = 0,
+        image_format: str = "png",
+        decimate: bool = False,
+    ) -> bytes:
+        """Return the image of SpiralPlot.draw, rendering only on a miss.
+
+        Args:
+            scales, octaves_below, octaves_above, decimate: see
+                SpiralPlot.draw; static images use render_mode "svg"
+            image_format (str): "png", "jpeg", "webp", "svg" or "pdf"
+
+        Returns:
+            bytes of the image file
+
+        Raises:
+            ValueError: if the cache has no image_dir
+        """
+        if self.image_dir is None:
+            raise ValueError("SpiralPlotCache has no image_dir for images")
+        key = SpiralPlot.content_key(
+            scales, octaves_below, octaves_above, "svg", decimate
+        )
+        path = self.image_dir / f"{key}.{image_format}"
+        if path.is_file():
+            self._image_hits += 1
+            path.touch()  # the modification time orders eviction
+            return path.read_bytes()
+        self._image_misses += 1
+        figure = self.draw(
+            scales, octaves_below, octaves_above, "svg", decimate
+        )
+        image = pio.to_image(figure, format=image_format)
+        path.write_bytes(image)
+        self._evict_images()
+        return image
+
+    def cache_info(self) -> SpiralPlotCacheInfo:
+        """Return the hit and miss counts and the sizes of the cache."""
+        return SpiralPlotCacheInfo(
+            self._figure_hits,
+            self._figure_misses,
+            len(self._figures),
+            self._image_hits,
+            self._image_misses,
+            sum(path.stat().st_size for path in self._image_paths()),
+        )
+
+    def clear(self) -> None:
+        """Empty the cache, deleting the stored images, and reset counts."""
+        self._figures.clear()
+        for path in self._image_paths():
+            path.unlink()
+        self._figure_hits = self._figure_misses = 0
+        self._image_hits = self._image_misses = 0
+
+    def _entry(self, key: str) -> _CacheEntry:
+        """Return the entry of a key, made empty on a miss, as most recent."""
+        if key in self._figures:
+            self._figures.move_to_end(key)
+            return self._figures[key]
+        entry = self._figures[key] = _CacheEntry()
+        while len(self._figures) > self.max_figures:
+            self._figures.popitem(last=False)
+        return entry
+
+    def _image_paths(self) -> list[Path]:
+        """Return the files of the image store."""
+        if self.image_dir is None:
+            return []
+        return [path for path in self.image_dir.iterdir() if path.is_file()]
+
+    def _evict_images(self) -> None:
+        """Delete least recently used images until within max_image_bytes."""
+        stats = sorted(
+            (path.stat().st_mtime_ns, path.stat().st_size, path)
+            for path in self._image_paths()
+        )
+        total = sum(size for _, size, _ in stats)
+        for _, size, path in stats:
+            if total <= self.max_image_bytes:
+                break
+            path.unlink()
+            total -= size
@@ -1,13 +1,41 @@
 """SpiralScale"""
 
 import math
-from typing import Iterable
-import pandas as pd
+from typing import TYPE_CHECKING, Iterable, Iterator, NamedTuple, Sequence
+import numpy as np
 from .. import Tone, Scale
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+class SpiralColumns(NamedTuple):
+    """Columnar polar plot data of one or more SpiralScales.
+
+    The name column is dictionary encoded, as a pandas Categorical or an
+    Arrow DictionaryArray: each row holds an index into names. All columns
+    are flat numpy arrays, so they convert to Arrow arrays without copying,
+    e.g. pyarrow.DictionaryArray.from_arrays(name_codes, names).
+
+    Attributes:
+        wavelength (numpy.ndarray): radial coordinate of each tone, float64
+        angle (numpy.ndarray): angular coordinate of each tone in degrees
+        name_codes (numpy.ndarray): index into names of each tone, int32
+        names (tuple[str, ...]): the scale names
+    """
+
+    wavelength: np.ndarray
+    angle: np.ndarray
+    name_codes: np.ndarray
+    names: tuple[str, ...]
+
 
 class SpiralScale:
-    """The geometric representation of a single scale as a log spiral."""
+    """The geometric representation of a single scale as a log spiral.
+
+    The coordinates are held as two read-only float64 arrays, radii and
+    angles, which are handed out without copying.
+    """
 
     _B_ANGLE = math.log(2) / 2 / math.pi  # scale for angle calculations
 
@@ -27,111 +55,186 @@ class SpiralScale:
                 wavelength to; default=1
         """
         zeroth = scale.principle if zeroth_tone is None else zeroth_tone
-        self._dataframe = self._generate_radii_and_angles(
-            scale, zeroth, scaling_factor
+        radii, angles = self.polar_coords_from_freqs(
+            scale.frequencies, zeroth.freq, scaling_factor
+        )
+        radii.flags.writeable = False
+        angles.flags.writeable = False
+        self._radii = radii
+        self._angles = angles
+        self._name = scale.scale_name
+
+    @property
+    def name(self) -> str:
+        """The name of the Scale."""
+        return self._name
+
+    @property
+    def radii(self) -> np.ndarray:
+        """The radial coordinate of each tone, as a read-only float64 array."""
+        return self._radii
+
+    @property
+    def angles(self) -> np.ndarray:
+        """The angle of each tone in degrees, as a read-only float64 array."""
+        return self._angles
+
+    def columns(self) -> SpiralColumns:
+        """Return the polar plot data as columns, without copying."""
+        return SpiralColumns(
+            self._radii,
+            self._angles,
+            np.zeros(len(self._radii), dtype=np.int32),
+            (self._name,),
         )
 
-    def get_dataframe_copy(self) -> pd.DataFrame:
-        """Return a copy of the internal dataframe of polar plot data.
+    @staticmethod
+    def concat_columns(spiral_scales: Sequence["SpiralScale"]) -> SpiralColumns:
+        """Return the polar plot data of many SpiralScales as one table.
 
-        Returns:
-            pandas.DataFrame with one row per scale tone, having columns:
+        Each coordinate is copied once, into its column; each scale name is
+        stored once.
+
+        Args:
+            spiral_scales (Sequence[SpiralScale]): the scales, in row order
 
-                wavelength (float) : radial coordinate of the tone
-                angle      (float) : angular coordinate of the tone, in degrees
-                name       (str)   : the key name of the Scale
+        Returns:
+            SpiralColumns, with names in order of first appearance
         """
-        return self._dataframe.copy()
+        names: dict[str, int] = {}
+        codes = [
+            names.setdefault(spiral_scale.name, len(names))
+            for spiral_scale in spiral_scales
+        ]
+        lengths = [len(spiral_scale.radii) for spiral_scale in spiral_scales]
+        return SpiralColumns(
+            np.concatenate([s.radii for s in spiral_scales] or [np.empty(0)]),
+            np.concatenate([s.angles for s in spiral_scales] or [np.empty(0)]),
+            np.repeat(np.array(codes, dtype=np.int32), lengths),
+            tuple(names),
+        )
 
-    def _generate_radii_and_angles(
-        self,
-        scale: Scale,
-        zeroth: Tone,
-        scaling_factor: float,
-    ) -> pd.DataFrame:
-        """Return a dataframe of polar-plot data for a scale.
+    def get_dataframe_copy(self) -> "pd.DataFrame":
+        """Return a new dataframe of the polar plot data.
 
-        Args:
-            scale (Scale): the scale from which to build the dataframe
-            zeroth (Tone): the Tone to be placed at 12 o'clock position
-            scaling_factor (float): the radius to scale the zeroth tone's
-                wavelength to
+        Prefer radii, angles or columns, which do not copy; this imports
+        pandas on first use.
 
         Returns:
-            pandas.DataFrame; see get_dataframe_copy() for details
+            pandas.DataFrame with one row per scale tone, having columns:
+
+                wavelength (float)   : radial coordinate of the tone
+                angle      (float)   : angular coordinate of the tone, degrees
+                name       (category): the name of the Scale
         """
-        coords = self._generate_polar_coords(
-            scale.primaries, zeroth, scaling_factor
+        import pandas as pd  # pylint: disable=import-outside-toplevel
+
+        columns = self.columns()
+        return pd.DataFrame(
+            {
+                "wavelength": columns.wavelength,
+                "angle": columns.angle,
+                "name": pd.Categorical.from_codes(
+                    columns.name_codes, categories=columns.names
+                ),
+            }
         )
-        df = pd.DataFrame(coords, columns=("wavelength", "angle"))
-        df["name"] = scale.scale_name
-        return df
 
-    def _generate_polar_coords(
-        self,
-        tones: tuple[Tone, ...],
-        zeroth: Tone,
-        scaling_factor: float,
-    ) -> Iterable[tuple[float, float]]:
-        """Return polar coords of spiral positions from a given set of Tones.
+    @staticmethod
+    def polar_coords_from_freqs(
+        frequencies: Sequence[float] | np.ndarray,
+        zeroth_freq: float,
+        scaling_factor: float = 1,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Return polar coords of spiral positions from given frequencies.
 
         For radii, frequencies are inverted to get wavelengths and then scaled.
-        For angles, the zeroth Tone is placed at 12 o'clock (90 deg), and
+        For angles, the zeroth frequency is placed at 12 o'clock (90 deg), and
         rising tones are placed clockwise around the spiral, with a full octave
-        above the zeroth Tone returning to 12 o'clock.
+        above the zeroth frequency returning to 12 o'clock.
+
+        The whole array is converted in one pass, so no Scale is needed; e.g.
+        SpiralScale.polar_coords_from_freqs(scale.frequencies, 261.63).
 
         Args:
-            frequencies (sequence(Tone)): series of Tones to calculate
-            zeroth (Tone): the home Tone to be plotted at 12 o'clock
-            scale (float): the radius to rescale the zeroth wavelength
+            frequencies (numpy.ndarray): series of frequencies in Hz
+            zeroth_freq (float): the home frequency to be plotted at 12 o'clock
+            scaling_factor (float): the radius to rescale the zeroth
+                wavelength to; default=1
 
         Returns:
-            a list of 2-tuples of floats representing (radius, angle) for each
-            of the input Tones' frequencies
+            a 2-tuple of float64 arrays (radii, angles), with angles in degrees,
+            one element each per input frequency
         """
-        radii = [
-            self._radius_from_freq(t.freq, zeroth.freq, scaling_factor)
-            for t in tones
-        ]
-        angles = [self._angle_from_freq(t.freq, zeroth.freq) for t in tones]
-        return zip(radii, angles)
+        freqs = np.asarray(frequencies, dtype=np.float64)
+        radii = SpiralScale._radius_from_freq(
+            freqs, zeroth_freq, scaling_factor
+        )
+        angles = SpiralScale._angle_from_freq(freqs, zeroth_freq)
+        return radii, angles
+
+    @staticmethod
+    def iter_polar_coords(
+        frequency_chunks: Iterable[np.ndarray],
+        zeroth_freq: float,
+        scaling_factor: float = 1,
+    ) -> Iterator[tuple[np.ndarray, np.ndarray]]:
+        """Yield polar coords for a stream of frequency arrays, chunk by chunk.
+
+        Consumes e.g. HarmonicSeries.iter_frequency_chunks lazily, so that a
+        series too long to hold in memory can still be placed on the spiral.
+
+        Args:
+            frequency_chunks (Iterable[numpy.ndarray]): arrays of frequencies
+            zeroth_freq, scaling_factor: see polar_coords_from_freqs
+
+        Yields:
+            a 2-tuple of arrays (radii, angles) per input chunk, see
+            polar_coords_from_freqs
+        """
+        for freqs in frequency_chunks:
+            yield SpiralScale.polar_coords_from_freqs(
+                freqs, zeroth_freq, scaling_factor
+            )
 
     @staticmethod
     def _radius_from_freq(
-        frequency: float, principle: float, scaling_factor: float
-    ) -> float:
-        """Convert a frequency to a scaled wavelength.
+        frequency: np.ndarray, principle: float, scaling_factor: float
+    ) -> np.ndarray:
+        """Convert frequencies to scaled wavelengths.
 
         Args:
-            frequency (float): frequency in Hz
+            frequency (numpy.ndarray): frequencies in Hz
             principle (float): reference frequency in Hz
             scale (float): reference scale forcing principle wavelength==scale
 
         Returns:
-            the computed radius (float)
+            the computed radii (numpy.ndarray)
         """
         return scaling_factor * principle / frequency
 
     @staticmethod
-    def _angle_from_freq(frequency: float, zeroth: float) -> float:
-        """Convert a frequency to an angle on [0,360).
+    def _angle_from_freq(frequency: np.ndarray, zeroth: float) -> np.ndarray:
+        """Convert frequencies to angles on [0,360).
 
         Note, increasing the input frequency increases the angle in the
         polar plot, moving the plotted point clockwise.
 
         Args:
-            frequency (float): frequency in Hz
+            frequency (numpy.ndarray): frequencies in Hz
             zeroth (float): reference frequency so zeroth angle==0 deg
 
         Returns:
-            the computed angle in degrees (float)
+            the computed angles in degrees (numpy.ndarray)
         """
+        # one array, updated in place, to keep peak memory to the output size
+        angle = np.asarray(np.divide(zeroth, frequency))
         # compute in standard physics coords: rad, 0 is east, increase CCW
-        angle = (
-            math.log(zeroth / frequency) / SpiralScale._B_ANGLE + math.pi / 2
-        )
+        np.log(angle, out=angle)
+        angle /= SpiralScale._B_ANGLE
+        angle += math.pi / 2
         # transform to plotly polar plot coords: deg, 0 is north, increase CW
-        angle = (math.pi / 2 - angle) * 180 / math.pi
+        np.subtract(math.pi / 2, angle, out=angle)
+        angle *= 180 / math.pi
         # constrain to [0,360)
-        angle = angle % 360
-        return angle
+        return np.mod(angle, 360, out=angle)
@@ -28,7 +28,7 @@ class GraphObjectSpiralPlot:
         """
         dataframes = []
         for trace in self._figure.data:
-            assert isinstance(trace, go.Scatterpolar)
+            assert isinstance(trace, (go.Scatterpolar, go.Scatterpolargl))
             df = pd.DataFrame(
                 {
                     "wavelength": trace.r,
@@ -45,3 +45,11 @@ class GraphObjectSpiralPlot:
             tuple of marker symbol strings, one per scale trace
         """
         return tuple(trace.marker.symbol for trace in self._figure.data)
+
+    def get_marker_colors(self) -> tuple[str, ...]:
+        """Return the marker color assigned to each trace in the plot.
+
+        Returns:
+            tuple of marker color strings, one per scale trace
+        """
+        return tuple(trace.marker.color for trace in self._figure.data)
@@ -0,0 +1,62 @@
+"""Feature: Reuse drawn and rendered plots of identical inputs."""
+
+import tempfile
+import unittest
+import semitone as st
+from semitone.visuals import SpiralPlotCache
+
+
+class TestCache(unittest.TestCase):
+    """Feature tests for the SpiralPlotCache class."""
+
+    def test_reuse_figure_of_equal_scales(self):
+        cache = SpiralPlotCache()
+        fig_1 = cache.draw((st.Major("C"),), 0, 1)
+        jitter = 1 + 1e-6  # well within Tone.DELTA_CENTS
+        scale = st.Arbitrary(st.Major("C").frequencies * jitter)
+        scale.key_name = "C"
+        scale.scale_name = st.Major("C").scale_name
+        fig_2 = cache.draw((scale,), 0, 1)
+        self.assertIs(fig_1, fig_2)
+        self.assertEqual(
+            fig_1.to_json(),
+            st.SpiralPlot.draw((st.Major("C"),), 0, 1).to_json(),
+        )
+        info = cache.cache_info()
+        self.assertEqual((info.figure_hits, info.figure_misses), (1, 1))
+        cache.draw((st.Major("C"),), 0, 2)
+        info = cache.cache_info()
+        self.assertEqual((info.figure_hits, info.figure_misses), (1, 2))
+
+    def test_reuse_figure_json_of_equal_scales(self):
+        cache = SpiralPlotCache()
+        scales = (st.Major("C"), st.Minor("A"))
+        figure_json = cache.draw_json(scales, 0, 1)
+        self.assertEqual(figure_json, st.SpiralPlot.draw_json(scales, 0, 1))
+        self.assertIs(cache.draw_json(scales, 0, 1), figure_json)
+        info = cache.cache_info()
+        self.assertEqual((info.figure_hits, info.figure_misses), (1, 1))
+        self.assertEqual(info.figures, 1)
+
+    def test_evict_least_recently_used_figures(self):
+        cache = SpiralPlotCache(max_figures=2)
+        for key in ("C", "D", "C", "E", "C"):
+            cache.draw((st.Major(key),))
+        info = cache.cache_info()
+        self.assertEqual(info.figures, 2)
+        self.assertEqual((info.figure_hits, info.figure_misses), (2, 3))
+
+    def test_store_images_on_disk_within_size_limit(self):
+        with tempfile.TemporaryDirectory() as image_dir:
+            cache = SpiralPlotCache(image_dir=image_dir)
+            image = cache.to_image((st.Minor("A"),), image_format="svg")
+            self.assertEqual(
+                cache.to_image((st.Minor("A"),), image_format="svg"), image
+            )
+            info = cache.cache_info()
+            self.assertEqual((info.image_hits, info.image_misses), (1, 1))
+            self.assertEqual(info.image_bytes, len(image))
+
+            cache.max_image_bytes = len(image)
+            cache.to_image((st.Major("A"),), image_format="svg")
+            self.assertLessEqual(cache.cache_info().image_bytes, len(image))
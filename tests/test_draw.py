@@ -1,9 +1,14 @@
 """Feature: Draw tones on a logarithmic spiral."""
 
+import json
 import unittest
+import numpy as np
 import pandas as pd
 from pandas.testing import assert_frame_equal
+import plotly.graph_objects as go
+import plotly.io as pio
 import semitone as st
+from semitone.visuals import SpiralScale
 from tests.graph_object_spiral_plot import GraphObjectSpiralPlot
 
 
@@ -126,3 +131,140 @@ class TestDraw(unittest.TestCase):
             3,
             "Each scale should have a distinct marker symbol",
         )
+
+    def test_see_many_scales_with_distinct_marker_colors(self):
+        scales = tuple(st.Chromatic(key) for key in ("C", "D", "E", "F#"))
+        fig = st.SpiralPlot.draw(scales)
+        graph_object = GraphObjectSpiralPlot(fig)
+        colors = graph_object.get_marker_colors()
+        self.assertEqual(len(colors), 4)
+        self.assertEqual(
+            len(set(colors)),
+            4,
+            "Each scale should have a distinct marker color",
+        )
+        self.assertEqual(
+            [trace.name for trace in fig.data],
+            [scale.scale_name for scale in scales],
+        )
+
+    def test_reload_saved_figure_without_default_template(self):
+        fig = st.SpiralPlot.draw((st.Major("C"), st.Minor("A")))
+        saved = fig.to_json()
+        self.assertEqual(json.loads(saved)["layout"]["template"], {})
+        reloaded = pio.from_json(saved)
+        self.assertEqual(reloaded.layout.template.layout.to_plotly_json(), {})
+        self.assertEqual(
+            reloaded.data[1].marker.to_plotly_json(),
+            fig.data[1].marker.to_plotly_json(),
+        )
+
+    def test_see_dense_spirals_rendered_with_webgl(self):
+        scales = (st.Chromatic("C"), st.Major("E"))
+        fig_svg = st.SpiralPlot.draw(scales, render_mode="svg")
+        fig_gl = st.SpiralPlot.draw(scales, render_mode="webgl")
+        self.assertTrue(
+            all(isinstance(trace, go.Scatterpolargl) for trace in fig_gl.data)
+        )
+        for trace_svg, trace_gl in zip(fig_svg.data, fig_gl.data):
+            self.assertEqual(
+                trace_svg.marker.to_plotly_json(),
+                trace_gl.marker.to_plotly_json(),
+            )
+            np.testing.assert_allclose(trace_svg.r, trace_gl.r)
+        self.assertEqual(fig_svg.layout, fig_gl.layout)
+
+    def test_switch_to_webgl_automatically_past_threshold(self):
+        scale = st.Chromatic("C")
+        num_points = 12 * 3
+        original = st.SpiralPlot.WEBGL_POINT_THRESHOLD
+        try:
+            st.SpiralPlot.WEBGL_POINT_THRESHOLD = num_points
+            fig = st.SpiralPlot.draw((scale,), 1, 1)
+            self.assertIsInstance(fig.data[0], go.Scatterpolar)
+            st.SpiralPlot.WEBGL_POINT_THRESHOLD = num_points - 1
+            fig = st.SpiralPlot.draw((scale,), 1, 1)
+            self.assertIsInstance(fig.data[0], go.Scatterpolargl)
+        finally:
+            st.SpiralPlot.WEBGL_POINT_THRESHOLD = original
+
+    def test_reject_unknown_render_mode(self):
+        with self.assertRaises(ValueError):
+            st.SpiralPlot.draw((st.Chromatic("C"),), render_mode="canvas")
+
+    def test_decimate_dense_spirals_to_one_point_per_pixel(self):
+        scales = (st.Chromatic("C"), st.Major("D"))
+        fig_full = st.SpiralPlot.draw(scales, 8, 8)
+        fig = st.SpiralPlot.draw(scales, 8, 8, decimate=True)
+        for trace_full, trace in zip(fig_full.data, fig.data):
+            self.assertLess(len(trace.r), len(trace_full.r))
+            self.assertEqual(sum(trace.customdata), len(trace_full.r))
+            self.assertEqual(max(trace.r), max(trace_full.r))
+            self.assertIn("%{customdata}", trace.hovertemplate)
+        self.assertEqual(fig.layout.polar, fig_full.layout.polar)
+
+    def test_keep_sparse_spirals_whole_when_decimating(self):
+        scale = st.Chromatic("C")
+        fig_full = st.SpiralPlot.draw((scale,))
+        fig = st.SpiralPlot.draw((scale,), decimate=True)
+        np.testing.assert_allclose(fig.data[0].r, fig_full.data[0].r)
+        self.assertEqual(list(fig.data[0].customdata), [1] * 12)
+
+    def test_compute_polar_positions_from_raw_frequencies(self):
+        key_freq = st.Chromatic("C").principle.freq
+        freqs = np.array(st.Chromatic("C").frequencies)
+        radii, angles = SpiralScale.polar_coords_from_freqs(freqs, key_freq)
+        df_actual = pd.DataFrame({"wavelength": radii, "angle": angles})
+        df_expected = self.generate_points_expected_chromatic(
+            principle_angle_deg=0.0,
+            principle_radius=self.DEFAULT_PRINCIPLE_RADIUS,
+            num_tones=12,
+        )
+        assert_frame_equal(
+            df_actual,
+            df_expected,
+            check_exact=False,
+            atol=self.TEST_TOL,
+            rtol=0,
+        )
+
+    def test_read_polar_positions_without_copies(self):
+        spiral_scale = SpiralScale(st.Chromatic("C").extend(1, 1))
+        self.assertFalse(spiral_scale.radii.flags.writeable)
+        self.assertIs(spiral_scale.columns().wavelength, spiral_scale.radii)
+        with self.assertRaises(ValueError):
+            spiral_scale.angles[0] = 0.0
+        df_expected = self.generate_points_expected_chromatic(
+            principle_angle_deg=0.0,
+            principle_radius=self.DEFAULT_PRINCIPLE_RADIUS,
+            num_tones=12,
+        )
+        np.testing.assert_allclose(
+            spiral_scale.radii[12:24], df_expected["wavelength"]
+        )
+
+    def test_export_many_scales_as_columns_with_categorical_names(self):
+        spiral_scales = [
+            SpiralScale(scale)
+            for scale in (st.Major("C"), st.Minor("A"), st.Major("C"))
+        ]
+        columns = SpiralScale.concat_columns(spiral_scales)
+        self.assertEqual(columns.names, ("C ma", "A mi"))
+        self.assertEqual(list(columns.name_codes), [0] * 7 + [1] * 7 + [0] * 7)
+        self.assertEqual(len(columns.wavelength), 21)
+        df = spiral_scales[1].get_dataframe_copy()
+        self.assertEqual(df["name"].dtype, "category")
+        self.assertEqual(list(df["name"].unique()), ["A mi"])
+        np.testing.assert_allclose(df["angle"], spiral_scales[1].angles)
+
+    def test_compute_polar_positions_from_streamed_frequencies(self):
+        key_freq = st.Chromatic("C").principle.freq
+        chunks = st.HarmonicSeries.iter_frequency_chunks(
+            "C", max_multiplier=100, chunk_size=30
+        )
+        coords = SpiralScale.iter_polar_coords(chunks, key_freq)
+        radii = np.concatenate([r for r, _ in coords])
+        expected_radii, _ = SpiralScale.polar_coords_from_freqs(
+            st.HarmonicSeries("C", 100).frequencies, key_freq
+        )
+        np.testing.assert_allclose(radii, expected_radii)
@@ -0,0 +1,61 @@
+"""Feature: Overlay scales on a figure one at a time."""
+
+import json
+import unittest
+from plotly.io.json import to_json_plotly
+import semitone as st
+from semitone.visuals import SpiralFigure
+
+
+class TestFigure(unittest.TestCase):
+    """Feature tests for the SpiralFigure class."""
+
+    def test_add_scales_like_draw(self):
+        scales = (st.Major("C"), st.Minor("A"), st.Chromatic("G"))
+        spiral = SpiralFigure(octaves_above=1)
+        for scale in scales:
+            spiral.add_scale(scale)
+        drawn = st.SpiralPlot.draw(scales, octaves_above=1)
+        self.assertEqual(
+            spiral.scale_names, tuple(scale.scale_name for scale in scales)
+        )
+        self.assertEqual(
+            json.loads(spiral.figure.to_json()), json.loads(drawn.to_json())
+        )
+
+    def test_remove_and_restyle_only_one_trace(self):
+        spiral = SpiralFigure()
+        for scale in (st.Major("C"), st.Minor("A"), st.Major("G")):
+            spiral.add_scale(scale)
+        kept = to_json_plotly(spiral.figure.data[0])
+        spiral.restyle_scale("A mi", marker_color="black")
+        spiral.remove_scale("G ma")
+        self.assertEqual(spiral.scale_names, ("C ma", "A mi"))
+        self.assertEqual(to_json_plotly(spiral.figure.data[0]), kept)
+        self.assertEqual(spiral.figure.data[1].marker.color, "black")
+        with self.assertRaises(KeyError):
+            spiral.remove_scale("G ma")
+        with self.assertRaises(ValueError):
+            spiral.add_scale(st.Major("C"))
+
+    def test_update_radial_range_incrementally(self):
+        def transposed(octaves):
+            scale = st.Arbitrary(st.Major("C").frequencies * 2.0**octaves)
+            scale.key_name = "C"
+            scale.scale_name = f"C ma {octaves:+}"
+            return scale
+
+        spiral = SpiralFigure()
+        spiral.add_scale(transposed(0))
+        c_range = spiral.figure.layout.polar.radialaxis.range
+        spiral.add_scale(transposed(1))
+        self.assertEqual(spiral.figure.layout.polar.radialaxis.range, c_range)
+        spiral.add_scale(transposed(-1))
+        low_range = spiral.figure.layout.polar.radialaxis.range
+        self.assertGreater(low_range[1], c_range[1])
+        spiral.remove_scale("C ma -1")
+        self.assertEqual(spiral.figure.layout.polar.radialaxis.range, c_range)
+        spiral.remove_scale("C ma +0")
+        self.assertLess(
+            spiral.figure.layout.polar.radialaxis.range[1], c_range[1]
+        )
@@ -1,6 +1,8 @@
 """Feature: Generate a scale's primary frequencies."""
 
 import unittest
+from fractions import Fraction
+import numpy as np
 import semitone as st
 
 
@@ -56,3 +58,136 @@ class TestFreqs(unittest.TestCase):
         for scale_name, scale in scales:
             with self.subTest(scale_name=scale_name):
                 self.assertEqual(scale, expected_scales[scale_name])
+
+    def test_read_primary_frequencies_as_array(self):
+        scale = st.Major("C")
+        freqs = scale.frequencies
+        self.assertEqual(freqs.dtype, np.float64)
+        self.assertEqual(len(freqs), len(scale.primaries))
+        for freq, tone in zip(freqs, scale.primaries):
+            self.assertEqual(st.Tone(freq), tone)
+        with self.assertRaises(ValueError):
+            freqs[0] = 0.0
+
+    def test_lookup_frequencies_of_notes_in_scientific_pitch(self):
+        expected_freqs = {
+            "A4": 440.0,
+            "A": 440.0,
+            "C4": 261.63,
+            "C#5": 554.37,
+            "Db5": 554.37,
+            "Bb-1": 14.57,
+            "A4+13c": 443.32,
+            "A4-100c": 415.30,
+        }
+        for name, expected_freq in expected_freqs.items():
+            with self.subTest(name=name):
+                freq = st.EqualTempered.freq_from_pitch(name)
+                self.assertAlmostEqual(freq, expected_freq, places=2)
+        for bad_name in ("H4", "C##4", "A4+13", "a4"):
+            with self.subTest(name=bad_name):
+                with self.assertRaises(ValueError):
+                    st.EqualTempered.freq_from_pitch(bad_name)
+
+    def test_lookup_frequencies_of_many_notes_at_once(self):
+        names = ["C4", "E4", "G4", "C5"] * 100
+        freqs = st.EqualTempered.freqs_from_names(names)
+        self.assertEqual(freqs.shape, (400,))
+        expected_freqs = [st.EqualTempered.freq_from_pitch(n) for n in names]
+        self.assertEqual(freqs.tolist(), expected_freqs)
+
+    def test_name_nearest_notes_of_many_frequencies(self):
+        scale = st.HarmonicOctave("C", 13)
+        spelling = st.EqualTempered("C").spell(scale.frequencies)
+        self.assertEqual(
+            spelling.pitches(),
+            ("C4+0.0c", "D4+3.9c", "E4-13.7c", "Gb4-48.7c")
+            + ("G4+2.0c", "Ab4+40.5c", "Bb4-31.2c"),
+        )
+        for pitch, freq in zip(spelling.pitches(3), scale.frequencies):
+            with self.subTest(pitch=pitch):
+                self.assertEqual(
+                    st.Tone(st.EqualTempered.freq_from_pitch(pitch)),
+                    st.Tone(freq),
+                )
+
+    def test_name_notes_with_sharps_in_sharp_keys(self):
+        freqs = st.Chromatic("C").extend(1, 0).frequencies
+        spelling = st.EqualTempered("A").spell(freqs)
+        self.assertEqual(spelling.names[:3].tolist(), ["C", "C#", "D"])
+        self.assertEqual(spelling.octaves[[0, 12]].tolist(), [3, 4])
+        self.assertTrue((abs(spelling.cents) < 1e-9).all())
+
+    def test_read_exact_ratios_of_harmonic_octave(self):
+        scale = st.HarmonicOctave("C", 13)
+        ratios = scale.ratios
+        expected_ratios = tuple(
+            Fraction(n, d)
+            for n, d in ((1, 1), (9, 8), (5, 4), (11, 8))
+            + ((3, 2), (13, 8), (7, 4))
+        )
+        self.assertEqual(ratios, expected_ratios)
+        for ratio, freq in zip(ratios, scale.frequencies):
+            self.assertEqual(
+                st.Tone(freq), st.Tone(scale.principle.freq * float(ratio))
+            )
+
+    def test_refuse_to_set_frequencies_of_just_scales(self):
+        scale = st.HarmonicSeries("C", 3)
+        with self.assertRaises(AttributeError):
+            scale.primaries = scale.primaries + (st.Tone(2000.0),)
+        with self.assertRaises(AttributeError):
+            scale.frequencies = scale.frequencies * 2
+        self.assertEqual(len(scale.ratios), len(scale.frequencies))
+        self.assertEqual(len(scale.extend(1, 1).ratios), 9)
+
+    def test_stream_harmonic_series_in_chunks(self):
+        scale = st.HarmonicSeries("C", 1000)
+        chunks = tuple(
+            st.HarmonicSeries.iter_frequency_chunks(
+                "C", max_multiplier=1000, chunk_size=300
+            )
+        )
+        self.assertEqual([len(chunk) for chunk in chunks], [300, 300, 300, 100])
+        self.assertEqual(st.Arbitrary(np.concatenate(chunks)), scale)
+
+        max_freq = scale.frequencies[99]
+        bounded = st.HarmonicSeries.iter_frequency_chunks(
+            "C", max_freq=max_freq
+        )
+        self.assertEqual(
+            st.Arbitrary(next(bounded)), st.HarmonicSeries("C", 100)
+        )
+        self.assertIsNone(next(bounded, None))
+
+        principle = st.EqualTempered.freq_from_name("C")
+        for multiplier in (3, 7, 127, 1000, 4099):
+            with self.subTest(multiplier=multiplier):
+                bounded = st.HarmonicSeries.iter_frequency_chunks(
+                    "C", max_freq=principle * multiplier
+                )
+                self.assertEqual(
+                    sum(len(chunk) for chunk in bounded), multiplier
+                )
+
+    def test_read_exact_ratios_of_extended_just_scales(self):
+        scale = st.HarmonicSeries("C", 6).extend(1, 1, unique=True)
+        self.assertEqual(
+            scale.ratios,
+            tuple(Fraction(n, 2) for n in range(1, 7))
+            + tuple(Fraction(n) for n in (4, 5, 6, 8, 10, 12)),
+        )
+        self.assertEqual(scale.numerators.dtype, np.int64)
+        far = st.HarmonicSeries("C", 1000).extend(2, 54)
+        self.assertEqual(far.ratios[0], Fraction(1, 4))
+        self.assertEqual(far.ratios[-1], Fraction(1000 * 2**54))
+        self.assertEqual(far.numerators[-1], 1000 * 2**54)
+        self.assertEqual(
+            tuple(zip(scale.numerators[:3], scale.denominators[:3])),
+            ((1, 2), (1, 1), (3, 2)),
+        )
+        in_range = st.HarmonicOctave("C", 9).tones_between(500, 1000)
+        self.assertEqual(
+            in_range.ratios,
+            tuple(Fraction(n, 4) for n in (8, 9, 10, 12, 14)),
+        )
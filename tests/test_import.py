@@ -2,6 +2,8 @@
 
 import unittest
 import importlib
+import subprocess
+import sys
 
 
 class TestImport(unittest.TestCase):
@@ -42,6 +44,9 @@ class TestImport(unittest.TestCase):
         "SpiralPlot",
     ]
 
+    # Heavy dependencies only needed for plotting
+    PLOTTING_MODULES = ["plotly", "pandas", "kaleido"]
+
     def test_import_modules(self):
         for name in self.MODULES:
             with self.subTest(module=name):
@@ -57,3 +62,21 @@ class TestImport(unittest.TestCase):
                 self.assertTrue(
                     hasattr(pkg, name), f"semitone.{name} not exported"
                 )
+
+    def test_compute_scales_without_loading_plotting_libraries(self):
+        code = (
+            "import sys\n"
+            "import semitone as st\n"
+            "st.Major('C').extend(1, 1)\n"
+            f"heavy = {self.PLOTTING_MODULES}\n"
+            "loaded = [m for m in heavy if m in sys.modules]\n"
+            "print(*loaded)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        loaded = result.stdout.split()
+        self.assertEqual(loaded, [], "plotting libraries were imported")
@@ -0,0 +1,53 @@
+"""Feature: Measure the stages of building scales and drawing plots."""
+
+import unittest
+import semitone as st
+from semitone import instrumentation
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Feature tests for the instrumentation module."""
+
+    def test_time_each_stage_of_drawing_a_plot(self):
+        scales = (st.Chromatic("C"), st.Major("D"))
+        with instrumentation.record() as recording:
+            st.SpiralPlot.draw(scales, 1, 1, decimate=True)
+        stages = [event.stage for event in recording.events]
+        for stage in (
+            "SpiralPlot.generate_data",
+            "SpiralPlot.decimate",
+            "SpiralPlot.build_figure",
+        ):
+            self.assertIn(stage, stages)
+        self.assertEqual(stages[-1], "SpiralPlot.draw")
+        draw = recording.events[-1]
+        self.assertEqual(draw.points, 3 * (12 + 7))
+        self.assertGreater(draw.seconds, 0)
+        self.assertIsNone(draw.peak_bytes)
+        extends = [e for e in recording.events if e.stage == "Scale.extend"]
+        self.assertEqual([e.points for e in extends], [36, 21])
+
+    def test_receive_scale_construction_events_in_a_listener(self):
+        events = []
+        instrumentation.add_listener(events.append)
+        try:
+            st.HarmonicSeries("C", 50)
+        finally:
+            instrumentation.remove_listener(events.append)
+        st.HarmonicSeries("C", 50)
+        self.assertEqual(len(events), 1)
+        self.assertEqual(
+            (events[0].stage, events[0].detail, events[0].points),
+            ("Scale.construct", "HarmonicSeries", 50),
+        )
+
+    def test_measure_peak_allocation_and_profile(self):
+        with instrumentation.record(
+            trace_memory=True, profile=True
+        ) as recording:
+            st.HarmonicSeries("C", 100_000).extend(1, 1)
+        construct, extend = recording.events
+        self.assertGreaterEqual(construct.peak_bytes, 100_000 * 8)
+        self.assertGreaterEqual(extend.peak_bytes, 300_000 * 8)
+        functions = {name for _, _, name in recording.stats().stats}
+        self.assertIn("extend", functions)
@@ -1,6 +1,9 @@
 """Feature: Generate and manipulate sequences of tones aka scales."""
 
+import itertools
+import math
 import unittest
+import numpy as np
 import semitone as st
 
 
@@ -11,6 +14,16 @@ class TestScale(unittest.TestCase):
         self.assertScalesUseSameNotes(st.Major("C"), st.Minor("A"))
         self.assertScalesUseSameNotes(st.Major("C"), st.DiatonicMode("C", 1))
 
+    def test_match_pitch_classes_of_two_scales_at_once(self):
+        major = st.Major("C")
+        chromatic = st.Chromatic("C").extend(1, 1)
+        matches = st.Scale.pitch_class_matrix(major, chromatic)
+        self.assertEqual(matches.shape, (7, 36))
+        for i, t1 in enumerate(major.primaries):
+            for j, t2 in enumerate(chromatic.primaries):
+                self.assertEqual(matches[i, j], t1.same_pitch_class(t2))
+        self.assertTrue((matches.sum(axis=1) == 3).all())
+
     def test_extend_scale_by_number_of_octaves(self):
         base_scale = st.Major("C")
         octaves_below = 1
@@ -24,6 +37,103 @@ class TestScale(unittest.TestCase):
         for scale in list_of_subscales:
             self.assertScalesUseSameNotes(base_scale, scale)
 
+    def test_extend_multi_octave_scale_without_duplicate_tones(self):
+        base_scale = st.HarmonicSeries("C", 8)
+        extended_scale = base_scale.extend(1, 1, unique=True)
+        freqs = list(extended_scale.frequencies)
+        self.assertEqual(freqs, sorted(freqs))
+        tones = extended_scale.primaries
+        for t1, t2 in zip(tones, tones[1:]):
+            self.assertNotEqual(t1, t2)
+        multipliers = (0.5, 1, 1.5, 2, 2.5, 3, 3.5, 4, 5, 6, 7, 8)
+        multipliers += (10, 12, 14, 16)
+        expected_scale = st.Arbitrary(
+            tuple(base_scale.principle.freq * n for n in multipliers)
+        )
+        self.assertEqual(extended_scale, expected_scale)
+        self.assertEqual(extended_scale.scale_name, base_scale.scale_name)
+
+    def test_list_tones_within_frequency_range(self):
+        base_scale = st.Major("C")
+        lo_hz, hi_hz = 100.0, 1000.0
+        in_range = base_scale.tones_between(lo_hz, hi_hz)
+        expected_scale = st.Arbitrary(
+            tuple(
+                freq
+                for freq in base_scale.extend(2, 1).frequencies
+                if lo_hz <= freq <= hi_hz
+            )
+        )
+        self.assertEqual(in_range, expected_scale)
+        self.assertEqual(
+            tuple(base_scale.iter_tones_between(lo_hz, hi_hz)),
+            in_range.primaries,
+        )
+
+    def test_include_scale_tones_at_range_bounds(self):
+        for scale, lo_hz, hi_hz, expected_len in (
+            (st.Major("A"), 440.0, 880.0, 8),
+            (st.Chromatic("C"), 261.63, 523.25, 13),
+        ):
+            with self.subTest(scale=scale.scale_name):
+                in_range = scale.tones_between(lo_hz, hi_hz)
+                self.assertEqual(len(in_range.primaries), expected_len)
+                self.assertEqual(in_range.primaries[0], st.Tone(lo_hz))
+                self.assertEqual(in_range.primaries[-1], st.Tone(hi_hz))
+                self.assertEqual(
+                    tuple(scale.iter_tones_between(lo_hz, hi_hz)),
+                    in_range.primaries,
+                )
+
+    def test_stop_early_when_iterating_an_open_ended_range(self):
+        base_scale = st.Chromatic("A")
+        tones = base_scale.iter_tones_between(lo_hz=1000.0)
+        first_tones = tuple(itertools.islice(tones, 25))
+        self.assertEqual(len(first_tones), 25)
+        self.assertGreaterEqual(first_tones[0], st.Tone(1000.0))
+        self.assertEqual(first_tones[24], st.Tone(first_tones[12].freq * 2))
+
+    def test_check_whether_tones_belong_to_scale(self):
+        scale = st.Major("C")
+        for tone in scale.primaries:
+            with self.subTest(tone=tone):
+                self.assertIn(tone, scale)
+                self.assertIn(tone.freq, scale)
+        self.assertNotIn(st.Tone(277.18), scale)  # C#4
+        self.assertNotIn(st.Tone(523.25), scale)  # C5
+
+    def test_find_nearest_scale_tones_to_measured_frequencies(self):
+        scale = st.Arbitrary((440.0, 261.63, 329.63))  # A4, C4, E4
+        index, deviation = scale.nearest(445.0)
+        self.assertEqual(scale.primaries[index], st.Tone(440.0))
+        self.assertAlmostEqual(deviation, 1200 * math.log2(445.0 / 440.0))
+
+        measured = np.array((200.0, 262.0, 300.0, 330.0, 1000.0))
+        indices, deviations = scale.nearest_many(measured)
+        nearest = tuple(scale.primaries[i] for i in indices)
+        self.assertEqual(
+            nearest,
+            tuple(st.Tone(f) for f in (261.63, 261.63, 329.63, 329.63, 440.0)),
+        )
+        for freq, tone, cents in zip(measured, nearest, deviations):
+            self.assertAlmostEqual(cents, 1200 * math.log2(freq / tone.freq))
+
+    def test_reuse_shared_instances_of_equal_tempered_scales(self):
+        st.EqualTempered.cache_clear()
+        first = st.Major("Eb")
+        second = st.Major("Eb")
+        self.assertIs(first, second)
+        self.assertIsNot(first, st.Minor("Eb"))
+        self.assertIsNot(first, st.DiatonicMode("Eb", 1))
+        info = st.EqualTempered.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 3))
+        with self.assertRaises(AttributeError):
+            first.scale_name = "changed"
+        self.assertEqual(first.extend(1, 1).scale_name, "Eb ma")
+        st.EqualTempered.cache_clear()
+        self.assertIsNot(first, st.Major("Eb"))
+        self.assertEqual(first, st.Major("Eb"))
+
     def split_multi_octave_scale(
         self, scale: st.Scale, num_primaries: int
     ) -> list[st.Arbitrary]:
@@ -12,14 +12,14 @@ class TestTone(unittest.TestCase):
     BASE_FREQ = 440.0
 
     def test_compare_slightly_different_tones_expect_equal(self):
-        delta = self.BASE_FREQ * (self.DELTA_CENTS - self.JITTER_CENTS) / 1200
+        ratio = pow(2, (self.DELTA_CENTS - self.JITTER_CENTS) / 1200)
 
         base_tone = Tone(self.BASE_FREQ)
 
         varying_tones = (
             Tone(self.BASE_FREQ),
-            Tone(self.BASE_FREQ - delta),
-            Tone(self.BASE_FREQ + delta),
+            Tone(self.BASE_FREQ / ratio),
+            Tone(self.BASE_FREQ * ratio),
         )
 
         for tone in varying_tones:
@@ -27,15 +27,58 @@ class TestTone(unittest.TestCase):
                 self.assertEqual(base_tone, tone)
 
     def test_compare_slightly_different_tones_expect_unequal(self):
-        delta = self.BASE_FREQ * (self.DELTA_CENTS + self.JITTER_CENTS) / 1200
+        ratio = pow(2, (self.DELTA_CENTS + self.JITTER_CENTS) / 1200)
 
         base_tone = Tone(self.BASE_FREQ)
 
         varying_tones = (
-            Tone(self.BASE_FREQ - delta),
-            Tone(self.BASE_FREQ + delta),
+            Tone(self.BASE_FREQ / ratio),
+            Tone(self.BASE_FREQ * ratio),
         )
 
         for tone in varying_tones:
             with self.subTest(base_tone=base_tone, tone=tone):
                 self.assertNotEqual(base_tone, tone)
+
+    def test_collect_tones_in_a_set(self):
+        ratio = pow(2, (self.DELTA_CENTS / 2) / 1200)
+        tones = {Tone(self.BASE_FREQ), Tone(self.BASE_FREQ * 2)}
+        self.assertEqual(len(tones), 2)
+        self.assertIn(Tone(self.BASE_FREQ), tones)
+        self.assertNotIn(Tone(self.BASE_FREQ * 3), tones)
+        lookup = {Tone(self.BASE_FREQ): "A4"}
+        self.assertEqual(lookup[Tone(self.BASE_FREQ)], "A4")
+        flat_c, sharp_c = (
+            Tone(self.BASE_FREQ * pow(2, (-900 + jitter) / 1200))
+            for jitter in (-1e-6, 1e-6)
+        )
+        self.assertEqual(hash(flat_c), hash(sharp_c))
+        self.assertEqual(
+            Tone.unique(
+                (
+                    Tone(self.BASE_FREQ),
+                    Tone(self.BASE_FREQ * ratio),
+                    Tone(self.BASE_FREQ / ratio),
+                    Tone(self.BASE_FREQ * 2),
+                )
+            ),
+            (Tone(self.BASE_FREQ), Tone(self.BASE_FREQ * 2)),
+        )
+
+    def test_miss_equal_tones_across_a_bucket_edge_in_a_set(self):
+        below_edge, above_edge = (
+            Tone(self.BASE_FREQ * pow(2, cents / 1200))
+            for cents in (0.49 * self.DELTA_CENTS, 0.51 * self.DELTA_CENTS)
+        )
+        self.assertEqual(below_edge, above_edge)
+        self.assertNotIn(above_edge, {below_edge})
+        self.assertEqual(Tone.unique((below_edge, above_edge)), (below_edge,))
+        self.assertEqual(
+            Tone.common((above_edge,), (below_edge,)), (above_edge,)
+        )
+
+    def test_intersect_collections_of_tones(self):
+        ratio = pow(2, (self.DELTA_CENTS / 2) / 1200)
+        tones_1 = tuple(Tone(self.BASE_FREQ * n) for n in range(1, 10))
+        tones_2 = tuple(Tone(self.BASE_FREQ * ratio * n) for n in (2, 4, 8))
+        self.assertEqual(Tone.common(tones_1, tones_2), tones_2)
@@ -1,8 +1,15 @@
 """Feature: Export plots to various image formats."""
 
+import io
+import json
+import os
+import tempfile
 import unittest
+from unittest import mock
+import xml.etree.ElementTree as ET
+import plotly.io as pio
 import semitone as st
-import os
+from semitone.visuals import SpiralExportSpec
 
 
 class TestWriteImage(unittest.TestCase):
@@ -30,3 +37,67 @@ class TestWriteImage(unittest.TestCase):
         # Clean up the created image file
         if os.path.isfile(output_file):
             os.remove(output_file)
+
+    def test_draw_svg_without_image_engine(self):
+        scales = (st.Major("C"), st.Minor("D"))
+        svg = st.SpiralPlot.draw_svg(scales, 1, 0)
+
+        root = ET.fromstring(svg)
+        ns = "{http://www.w3.org/2000/svg}"
+        points = [
+            use
+            for group in root.iter(ns + "g")
+            for use in group.iter(ns + "use")
+        ]
+        # two octaves of 7 tones per scale, plus one legend entry per scale
+        self.assertEqual(len(points), 2 * 14 + 2)
+        fills = {group.get("fill") for group in root.iter(ns + "g")}
+        self.assertEqual(len(fills), 2)
+        texts = [text.text for text in root.iter(ns + "text")]
+        self.assertIn("Db/C#", texts)
+        self.assertIn(scales[1].scale_name, texts)
+
+    def test_write_json_matching_drawn_figure(self):
+        scales = (st.Major("C"), st.HarmonicSeries("D", 50))
+        for render_mode in ("svg", "webgl"):
+            with self.subTest(render_mode=render_mode):
+                figure_json = st.SpiralPlot.draw_json(
+                    scales, 1, 2, render_mode, decimate=True
+                )
+                drawn = st.SpiralPlot.draw(
+                    scales, 1, 2, render_mode, decimate=True
+                )
+                self.assertEqual(
+                    json.loads(figure_json), json.loads(drawn.to_json())
+                )
+                self.assertNotIn("<", figure_json)
+
+        stream = io.StringIO()
+        with mock.patch(
+            "semitone.visuals._json_writer.SpiralJsonWriter.CHUNK_SIZE", 5
+        ):
+            st.SpiralPlot.write_json(stream, scales, 0, 1)
+        figure = pio.from_json(stream.getvalue())
+        self.assertEqual(len(figure.data[1].r), 2 * 50)
+
+    def test_export_many_images_skipping_up_to_date_ones(self):
+        specs = [
+            SpiralExportSpec("c_major.png", (st.Major("C"),)),
+            SpiralExportSpec("d_minor.svg", (st.Minor("D"),), 0, 1),
+        ]
+        with tempfile.TemporaryDirectory() as out_dir:
+            results = st.SpiralPlot.export_many(specs, out_dir, workers=2)
+            self.assertEqual(
+                [result.path.name for result in results],
+                ["c_major.png", "d_minor.svg"],
+            )
+            for result in results:
+                self.assertTrue(result.path.is_file())
+                self.assertFalse(result.skipped)
+                self.assertGreater(result.seconds, 0)
+
+            specs[1] = SpiralExportSpec("d_minor.svg", (st.Minor("D"),))
+            results = st.SpiralPlot.export_many(specs, out_dir, workers=2)
+            self.assertEqual(
+                [result.skipped for result in results], [True, False]
+            )